@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+# Asynchronous emits are repeated inside a single coroutine, so that starting the event loop is not measured
+REPEATS = 100
+
+# Positional and keyword arguments passed to `emit()`
+SHAPES: dict[str, tuple[tuple[Any, ...], dict[str, Any]]] = {
+    "no-args": ((), {}),
+    "args": ((1, "two", 3.0), {}),
+    "kwargs": ((), {"one": 1, "two": "two", "three": 3.0}),
+    "args-kwargs": ((1, "two"), {"three": 3.0}),
+}
+
+
+def listener(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+async def async_listener(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+def make_listener() -> Callable[..., None]:
+    def listener(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    return listener
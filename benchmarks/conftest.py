@@ -0,0 +1,44 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, Type, Union
+
+import pytest
+
+import eventemitter
+from eventemitter import AsyncIOEventEmitter, EventEmitter
+
+benchmarks_path = Path(__file__).parent.absolute()
+sys.path.append(str(benchmarks_path))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Benchmarks add many listeners for an event on purpose
+    config.addinivalue_line("filterwarnings", "ignore::eventemitter.MaxListenersExceededWarning")
+
+
+def pytest_benchmark_update_json(config: pytest.Config, benchmarks: Any, output_json: Dict[str, Any]) -> None:
+    # Results are compared between releases, so record which one has been measured
+    output_json["eventemitter"] = {"version": eventemitter.__version__}
+
+
+@pytest.fixture
+def ee() -> EventEmitter:
+    return EventEmitter()
+
+
+@pytest.fixture
+def aee() -> AsyncIOEventEmitter:
+    return AsyncIOEventEmitter()
+
+
+@pytest.fixture(params=[EventEmitter, AsyncIOEventEmitter], ids=["EventEmitter", "AsyncIOEventEmitter"])
+def emitter_cls(request: pytest.FixtureRequest) -> Type[Union[EventEmitter, AsyncIOEventEmitter]]:
+    return request.param
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
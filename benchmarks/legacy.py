@@ -0,0 +1,51 @@
+"""Previous implementations kept as baselines for the benchmarks."""
+
+import asyncio
+from collections import UserList
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from typing_extensions import ParamSpec, TypeVar
+
+from eventemitter.types import AsyncCallable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def run_coroutine(coroutine: AsyncCallable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    def event_loop() -> R:
+        loop = asyncio.new_event_loop()
+
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(coroutine(*args, **kwargs))
+        finally:
+            loop.close()
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(event_loop)
+    return future.result()
+
+
+class ListHandlers(UserList):
+    """`UserList`-based `Handlers`, which scans the list to find a handler."""
+
+    def prepend(self, handler: Any) -> None:
+        self.data.insert(0, handler)
+
+    def remove(self, target: Any, last: bool = False) -> Any:
+        indices = range(len(self.data) - 1, -1, -1) if last else range(len(self.data))
+        for index in indices:
+            if self.data[index] is target:
+                return self.data.pop(index)
+
+        raise ValueError(f"{target!r} not in list")
+
+    def remove_by_id(self, target: Any, last: bool = False) -> Any:
+        indices = range(len(self.data) - 1, -1, -1) if last else range(len(self.data))
+        for index in indices:
+            if id(self.data[index].func) == id(target):
+                return self.data.pop(index)
+
+        raise ValueError(f"{target!r} not in list")
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from typing import Optional
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import AsyncIOEventEmitter
+
+NUM_LISTENERS = 200
+POOL_SIZE = 10
+IO_TIME = 0.001
+
+
+@pytest.mark.parametrize("max_concurrency", [None, 50, 10, 5], ids=lambda value: f"max_concurrency={value}")
+def test_max_concurrency(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    max_concurrency: Optional[int],
+) -> None:
+    benchmark.group = f"concurrency: {NUM_LISTENERS} listeners sharing a pool of {POOL_SIZE} connections"
+
+    aee = AsyncIOEventEmitter(max_concurrency=max_concurrency)
+    waits: list[float] = []
+
+    async def query(pool: asyncio.Semaphore) -> None:
+        async with pool:
+            await asyncio.sleep(IO_TIME)
+
+    async def listener(pool: asyncio.Semaphore) -> None:
+        await query(pool)
+
+    for _ in range(NUM_LISTENERS):
+        aee.on("foo", listener)
+
+    async def emit() -> None:
+        pool = asyncio.Semaphore(POOL_SIZE)
+        done = asyncio.Event()
+
+        # Another part of the service keeps using the same pool while the listeners run
+        async def request() -> None:
+            while not done.is_set():
+                start = time.perf_counter()
+                await query(pool)
+                waits.append(time.perf_counter() - start - IO_TIME)
+
+        requester = asyncio.ensure_future(request())
+        await aee.emit("foo", pool)
+        done.set()
+        await requester
+
+    benchmark.pedantic(lambda: loop.run_until_complete(emit()), rounds=10)
+
+    waits.sort()
+    benchmark.extra_info["request_wait_p50_ms"] = statistics.median(waits) * 1_000
+    benchmark.extra_info["request_wait_p99_ms"] = waits[int(len(waits) * 0.99)] * 1_000
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from common import REPEATS
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import AsyncIOEventEmitter
+
+
+async def cached(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
+async def suspending(*args: Any, **kwargs: Any) -> None:
+    await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize("eager", [False, True], ids=["default", "eager"])
+@pytest.mark.parametrize("suspending_ratio", [0.0, 0.1, 0.5])
+@pytest.mark.parametrize("num_listeners", [10, 100])
+def test_eager(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    num_listeners: int,
+    suspending_ratio: float,
+    eager: bool,
+) -> None:
+    # Eager dispatch requires Python 3.12 or later, so both modes measure the same thing on earlier versions
+    benchmark.group = f"eager: {num_listeners} listeners, {suspending_ratio:.0%} suspending, x{REPEATS}"
+
+    aee = AsyncIOEventEmitter(eager=eager)
+    num_suspending = int(num_listeners * suspending_ratio)
+    for index in range(num_listeners):
+        aee.on("foo", suspending if index < num_suspending else cached)
+
+    async def emit() -> None:
+        for _ in range(REPEATS):
+            await aee.emit("foo", 42)
+
+    benchmark(lambda: loop.run_until_complete(emit()))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from common import REPEATS, SHAPES, async_listener, listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import AsyncIOEventEmitter, EventEmitter
+
+counts = pytest.mark.parametrize("num_listeners", [1, 10, 100])
+shapes = pytest.mark.parametrize("shape", list(SHAPES))
+kinds = pytest.mark.parametrize("kind", ["sync", "async", "mixed"])
+
+
+def add_listeners(aee: AsyncIOEventEmitter, num_listeners: int, kind: str) -> None:
+    for index in range(num_listeners):
+        if kind == "sync" or (kind == "mixed" and index % 2 == 0):
+            aee.on("foo", listener)
+        else:
+            aee.on("foo", async_listener)
+
+
+@counts
+@shapes
+def test_emit(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int, shape: str) -> None:
+    benchmark.group = f"emit: EventEmitter, {num_listeners} listeners"
+
+    for _ in range(num_listeners):
+        ee.on("foo", listener)
+
+    args, kwargs = SHAPES[shape]
+    benchmark(lambda: ee.emit("foo", *args, **kwargs))
+
+
+def test_emit_without_listeners(benchmark: BenchmarkFixture, ee: EventEmitter) -> None:
+    benchmark.group = "emit: EventEmitter, 0 listeners"
+    benchmark(ee.emit, "foo", 42)
+
+
+@counts
+@kinds
+def test_async_emit(
+    benchmark: BenchmarkFixture,
+    aee: AsyncIOEventEmitter,
+    loop: asyncio.AbstractEventLoop,
+    num_listeners: int,
+    kind: str,
+) -> None:
+    benchmark.group = f"emit: AsyncIOEventEmitter, {num_listeners} listeners, x{REPEATS}"
+    add_listeners(aee, num_listeners, kind)
+
+    async def emit() -> None:
+        for _ in range(REPEATS):
+            await aee.emit("foo", 42)
+
+    benchmark(lambda: loop.run_until_complete(emit()))
+
+
+@shapes
+def test_async_emit_shapes(
+    benchmark: BenchmarkFixture,
+    aee: AsyncIOEventEmitter,
+    loop: asyncio.AbstractEventLoop,
+    shape: str,
+) -> None:
+    benchmark.group = f"emit: AsyncIOEventEmitter, 10 mixed listeners, x{REPEATS}"
+    add_listeners(aee, 10, "mixed")
+
+    args, kwargs = SHAPES[shape]
+
+    async def emit() -> None:
+        for _ in range(REPEATS):
+            await aee.emit("foo", *args, **kwargs)
+
+    benchmark(lambda: loop.run_until_complete(emit()))
+
+
+@counts
+@kinds
+def test_async_emit_in_order(
+    benchmark: BenchmarkFixture,
+    aee: AsyncIOEventEmitter,
+    loop: asyncio.AbstractEventLoop,
+    num_listeners: int,
+    kind: str,
+) -> None:
+    benchmark.group = f"emit_in_order: AsyncIOEventEmitter, {num_listeners} listeners, x{REPEATS}"
+    add_listeners(aee, num_listeners, kind)
+
+    async def emit_in_order() -> None:
+        for _ in range(REPEATS):
+            await aee.emit_in_order("foo", 42)
+
+    benchmark(lambda: loop.run_until_complete(emit_in_order()))
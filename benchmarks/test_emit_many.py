@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from common import async_listener, listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import AsyncIOEventEmitter, EventEmitter
+
+NUM_PAYLOADS = 1000
+PAYLOADS = [(index,) for index in range(NUM_PAYLOADS)]
+
+counts = pytest.mark.parametrize("num_listeners", [1, 10])
+
+
+def batch_listener(batch: list[tuple[Any, ...]]) -> None:
+    pass
+
+
+@counts
+def test_emit_loop(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int) -> None:
+    benchmark.group = f"emit_many: EventEmitter, {num_listeners} listeners, x{NUM_PAYLOADS}"
+
+    for _ in range(num_listeners):
+        ee.on("foo", listener)
+
+    def emit() -> None:
+        for args in PAYLOADS:
+            ee.emit("foo", *args)
+
+    benchmark(emit)
+
+
+@counts
+def test_emit_many(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int) -> None:
+    benchmark.group = f"emit_many: EventEmitter, {num_listeners} listeners, x{NUM_PAYLOADS}"
+
+    for _ in range(num_listeners):
+        ee.on("foo", listener)
+
+    benchmark(ee.emit_many, "foo", PAYLOADS)
+
+
+@counts
+def test_emit_many_batch(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int) -> None:
+    benchmark.group = f"emit_many: EventEmitter, {num_listeners} listeners, x{NUM_PAYLOADS}"
+
+    for _ in range(num_listeners):
+        ee.on_batch("foo", batch_listener)
+
+    benchmark(ee.emit_many, "foo", PAYLOADS)
+
+
+@counts
+def test_async_emit_loop(
+    benchmark: BenchmarkFixture,
+    aee: AsyncIOEventEmitter,
+    loop: asyncio.AbstractEventLoop,
+    num_listeners: int,
+) -> None:
+    benchmark.group = f"emit_many: AsyncIOEventEmitter, {num_listeners} listeners, x{NUM_PAYLOADS}"
+
+    for _ in range(num_listeners):
+        aee.on("foo", async_listener)
+
+    async def emit() -> None:
+        for args in PAYLOADS:
+            await aee.emit("foo", *args)
+
+    benchmark(lambda: loop.run_until_complete(emit()))
+
+
+@counts
+def test_async_emit_many(
+    benchmark: BenchmarkFixture,
+    aee: AsyncIOEventEmitter,
+    loop: asyncio.AbstractEventLoop,
+    num_listeners: int,
+) -> None:
+    benchmark.group = f"emit_many: AsyncIOEventEmitter, {num_listeners} listeners, x{NUM_PAYLOADS}"
+
+    for _ in range(num_listeners):
+        aee.on("foo", async_listener)
+
+    benchmark(lambda: loop.run_until_complete(aee.emit_many("foo", PAYLOADS)))
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import legacy
+import pytest
+from common import listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter.handlers import AbstractHandler, AsyncHandler, Handler, Handlers
+
+containers = pytest.mark.parametrize("container", [Handlers, legacy.ListHandlers], ids=["handlers", "list"])
+sizes = pytest.mark.parametrize("num_handlers", [10, 1_000, 100_000])
+
+
+def make_handlers(container: Callable[[], Any], num_handlers: int) -> Any:
+    handlers = container()
+    for _ in range(num_handlers):
+        handlers.append(Handler.from_func(lambda: None))
+
+    return handlers
+
+
+@containers
+@sizes
+def test_prepend(benchmark: BenchmarkFixture, container: Callable[[], Any], num_handlers: int) -> None:
+    benchmark.group = f"handlers: prepend, {num_handlers} handlers"
+
+    handlers = make_handlers(container, num_handlers)
+    handler = Handler.from_func(listener)
+
+    def prepend() -> None:
+        handlers.prepend(handler)
+        handlers.remove(handler)
+
+    benchmark(prepend)
+
+
+@containers
+@sizes
+def test_append(benchmark: BenchmarkFixture, container: Callable[[], Any], num_handlers: int) -> None:
+    benchmark.group = f"handlers: append, {num_handlers} handlers"
+
+    handlers = make_handlers(container, num_handlers)
+    handler = Handler.from_func(listener)
+
+    def append() -> None:
+        handlers.append(handler)
+        handlers.remove_by_id(listener, last=True)
+
+    benchmark(append)
+
+
+@containers
+@sizes
+def test_remove_middle(benchmark: BenchmarkFixture, container: Callable[[], Any], num_handlers: int) -> None:
+    benchmark.group = f"handlers: remove from the middle, {num_handlers} handlers"
+
+    def setup() -> tuple[tuple[Any, Any], dict[str, Any]]:
+        handlers = make_handlers(container, num_handlers)
+        return (handlers, list(handlers)[num_handlers // 2]), {}
+
+    benchmark.pedantic(lambda handlers, handler: handlers.remove(handler, last=True), setup=setup, rounds=20)
+
+
+@containers
+@sizes
+def test_iterate(benchmark: BenchmarkFixture, container: Callable[[], Any], num_handlers: int) -> None:
+    benchmark.group = f"handlers: iterate, {num_handlers} handlers"
+
+    handlers = make_handlers(container, num_handlers)
+
+    def iterate() -> None:
+        for _ in handlers:
+            pass
+
+    benchmark(iterate)
+
+
+@pytest.mark.parametrize("handler_cls", [Handler, AsyncHandler])
+def test_from_func(benchmark: BenchmarkFixture, handler_cls: type[AbstractHandler[Any]]) -> None:
+    benchmark.group = "handlers: from_func"
+    benchmark(handler_cls.from_func, listener, once=False)
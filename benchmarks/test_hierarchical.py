@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from common import listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import EventEmitter
+
+EVENT = ("db", "users", "insert")
+ANCESTORS = [EVENT[:end] for end in range(len(EVENT), 0, -1)]
+
+
+def test_emit_each_ancestor(benchmark: BenchmarkFixture, ee: EventEmitter) -> None:
+    benchmark.group = "hierarchical: EventEmitter, 3 levels"
+
+    for event in ANCESTORS:
+        ee.on(event, listener)
+
+    def emit() -> None:
+        for event in ANCESTORS:
+            ee.emit(event, 42)
+
+    benchmark(emit)
+
+
+def test_emit_bubbling(benchmark: BenchmarkFixture) -> None:
+    benchmark.group = "hierarchical: EventEmitter, 3 levels"
+
+    ee = EventEmitter(hierarchical=True)
+    for event in ANCESTORS:
+        ee.on(event, listener)
+
+    benchmark(ee.emit, EVENT, 42)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+from common import make_listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import EventEmitter
+
+counts = pytest.mark.parametrize("num_listeners", [1, 100])
+
+
+@counts
+def test_len_listeners(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int) -> None:
+    benchmark.group = f"introspection: listener count, {num_listeners} listeners"
+
+    for _ in range(num_listeners):
+        ee.on("foo", make_listener())
+
+    benchmark(lambda: len(ee.listeners("foo")))
+
+
+@counts
+def test_listener_count(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int) -> None:
+    benchmark.group = f"introspection: listener count, {num_listeners} listeners"
+
+    for _ in range(num_listeners):
+        ee.on("foo", make_listener())
+
+    benchmark(ee.listener_count, "foo")
+
+
+@counts
+def test_total_listener_count(benchmark: BenchmarkFixture, num_listeners: int) -> None:
+    benchmark.group = f"introspection: total listener count, {num_listeners} events"
+
+    ee = EventEmitter()
+    for index in range(num_listeners):
+        ee.on(index, make_listener())
+
+    benchmark(ee.listener_count)
+
+
+@counts
+def test_sum_listeners(benchmark: BenchmarkFixture, num_listeners: int) -> None:
+    benchmark.group = f"introspection: total listener count, {num_listeners} events"
+
+    ee = EventEmitter()
+    for index in range(num_listeners):
+        ee.on(index, make_listener())
+
+    benchmark(lambda: sum(len(ee.listeners(event)) for event in ee.events()))
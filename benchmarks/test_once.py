@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Type, Union
+
+import pytest
+from common import listener, make_listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import AsyncIOEventEmitter, EventEmitter
+
+NUM_LISTENERS = 100
+
+
+@pytest.mark.parametrize("once_ratio", [0.0, 0.1, 0.5, 1.0])
+def test_once(
+    benchmark: BenchmarkFixture,
+    loop: asyncio.AbstractEventLoop,
+    emitter_cls: Type[Union[EventEmitter, AsyncIOEventEmitter]],
+    once_ratio: float,
+) -> None:
+    benchmark.group = f"once: {emitter_cls.__name__}, {NUM_LISTENERS} listeners"
+
+    def setup() -> tuple[tuple[Union[EventEmitter, AsyncIOEventEmitter]], dict[str, Any]]:
+        emitter = emitter_cls()
+
+        num_once = int(NUM_LISTENERS * once_ratio)
+        for _ in range(NUM_LISTENERS - num_once):
+            emitter.on("response", listener)
+
+        # One-time listeners are usually distinct closures, e.g. one per in-flight request
+        for _ in range(num_once):
+            emitter.once("response", make_listener())
+
+        return (emitter,), {}
+
+    def emit(emitter: Union[EventEmitter, AsyncIOEventEmitter]) -> None:
+        if isinstance(emitter, AsyncIOEventEmitter):
+            loop.run_until_complete(emitter.emit("response", 42))
+        else:
+            emitter.emit("response", 42)
+
+    benchmark.pedantic(emit, setup=setup, rounds=1_000)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Type, Union
+
+import legacy
+import pytest
+from common import async_listener, listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import eventemitter.eventemitter
+from eventemitter import AsyncIOEventEmitter, EventEmitter
+from eventemitter.utils import run_coroutine
+
+meta_listeners = pytest.mark.parametrize("meta_listener", ["none", "sync", "async"])
+
+
+def add_meta_listeners(emitter: Union[EventEmitter, AsyncIOEventEmitter], meta_listener: str) -> None:
+    if meta_listener == "none":
+        return
+
+    if meta_listener == "async" and not isinstance(emitter, AsyncIOEventEmitter):
+        pytest.skip("EventEmitter does not support asynchronous listeners")
+
+    meta = async_listener if meta_listener == "async" else listener
+    emitter.on("new_listener", meta)
+    emitter.on("remove_listener", meta)
+
+
+@meta_listeners
+def test_add_listener(
+    benchmark: BenchmarkFixture,
+    emitter_cls: Type[Union[EventEmitter, AsyncIOEventEmitter]],
+    meta_listener: str,
+) -> None:
+    benchmark.group = f"add_listener: {emitter_cls.__name__}"
+
+    emitter = emitter_cls()
+    add_meta_listeners(emitter, meta_listener)
+
+    def register() -> None:
+        emitter.add_listener("foo", listener)
+        emitter.remove_listener("foo", listener)
+
+    benchmark(register)
+
+
+@meta_listeners
+def test_prepend_listener(
+    benchmark: BenchmarkFixture,
+    emitter_cls: Type[Union[EventEmitter, AsyncIOEventEmitter]],
+    meta_listener: str,
+) -> None:
+    benchmark.group = f"prepend_listener: {emitter_cls.__name__}"
+
+    emitter = emitter_cls()
+    add_meta_listeners(emitter, meta_listener)
+    for _ in range(100):
+        emitter.on("foo", listener)
+
+    def register() -> None:
+        emitter.prepend_listener("foo", async_listener)
+        emitter.remove_listener("foo", async_listener)
+
+    benchmark(register)
+
+
+@meta_listeners
+def test_once_without_emit(
+    benchmark: BenchmarkFixture,
+    emitter_cls: Type[Union[EventEmitter, AsyncIOEventEmitter]],
+    meta_listener: str,
+) -> None:
+    benchmark.group = f"once: {emitter_cls.__name__}, registered and removed"
+
+    emitter = emitter_cls()
+    add_meta_listeners(emitter, meta_listener)
+
+    def register() -> None:
+        emitter.once("foo", listener)
+        emitter.off("foo", listener)
+
+    benchmark(register)
+
+
+@pytest.mark.parametrize("runner", [run_coroutine, legacy.run_coroutine], ids=["persistent", "legacy"])
+def test_run_coroutine(
+    benchmark: BenchmarkFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    aee: AsyncIOEventEmitter,
+    runner: Callable[..., Any],
+) -> None:
+    benchmark.group = "add_listener: AsyncIOEventEmitter with asynchronous meta listeners, by event loop"
+    monkeypatch.setattr(eventemitter.eventemitter, "run_coroutine", runner)
+
+    add_meta_listeners(aee, "async")
+
+    def register() -> None:
+        aee.on("foo", listener)
+        aee.off("foo", listener)
+
+    benchmark(register)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, Type, Union
+
+import pytest
+from common import listener, make_listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import AsyncIOEventEmitter, EventEmitter
+
+counts = pytest.mark.parametrize("num_listeners", [10, 1_000, 10_000])
+
+
+@counts
+def test_churn(
+    benchmark: BenchmarkFixture,
+    emitter_cls: Type[Union[EventEmitter, AsyncIOEventEmitter]],
+    num_listeners: int,
+) -> None:
+    benchmark.group = f"churn: {num_listeners} listeners on a shared emitter"
+
+    emitter = emitter_cls()
+    for _ in range(num_listeners):
+        emitter.on("data", make_listener())
+
+    # Every connection registers its own listeners and removes them when it is closed
+    def churn() -> None:
+        connection = make_listener()
+        emitter.on("data", connection)
+        emitter.on("end", connection)
+        emitter.remove_listener("data", connection)
+        emitter.remove_listener("end", connection)
+
+    benchmark(churn)
+
+
+@counts
+def test_remove_listener_duplicates(benchmark: BenchmarkFixture, ee: EventEmitter, num_listeners: int) -> None:
+    benchmark.group = f"remove_listener: {num_listeners} instances of the same listener"
+
+    for _ in range(num_listeners):
+        ee.on("data", listener)
+
+    def remove() -> None:
+        ee.remove_listener("data", listener)
+        ee.on("data", listener)
+
+    benchmark(remove)
+
+
+@pytest.mark.parametrize("meta_listener", [False, True], ids=["plain", "remove_listener"])
+@counts
+def test_remove_all_listeners(
+    benchmark: BenchmarkFixture,
+    emitter_cls: Type[Union[EventEmitter, AsyncIOEventEmitter]],
+    num_listeners: int,
+    meta_listener: bool,
+) -> None:
+    benchmark.group = f"remove_all_listeners: {num_listeners} listeners"
+
+    def setup() -> tuple[tuple[Union[EventEmitter, AsyncIOEventEmitter]], dict[str, Any]]:
+        emitter = emitter_cls()
+        if meta_listener:
+            emitter.on("remove_listener", make_listener())
+
+        for _ in range(num_listeners):
+            emitter.on("data", make_listener())
+
+        return (emitter,), {}
+
+    benchmark.pedantic(lambda emitter: emitter.remove_all_listeners("data"), setup=setup, rounds=20)
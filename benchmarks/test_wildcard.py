@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+from common import listener
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from eventemitter import EventEmitter
+
+
+@pytest.mark.parametrize("num_patterns", [0, 10, 1000])
+def test_emit(benchmark: BenchmarkFixture, num_patterns: int) -> None:
+    benchmark.group = "wildcard: EventEmitter.emit()"
+
+    ee = EventEmitter(wildcard=num_patterns > 0)
+    ee.on("order.created", listener)
+
+    # Only one of the patterns matches the event
+    for index in range(num_patterns - 1):
+        ee.on(f"topic{index}.*", listener)
+
+    if num_patterns:
+        ee.on("*.created", listener)
+
+    benchmark(ee.emit, "order.created", 42)
+
+
+@pytest.mark.parametrize("num_patterns", [10, 1000])
+def test_emit_uncached(benchmark: BenchmarkFixture, num_patterns: int) -> None:
+    benchmark.group = "wildcard: EventEmitter.emit() of a new event"
+
+    ee = EventEmitter(wildcard=True)
+    for index in range(num_patterns):
+        ee.on(f"topic{index}.*", listener)
+
+    events = iter(f"topic0.{index}" for index in range(10**9))
+
+    # Every emit resolves a name it has not seen yet, so this measures the pattern index rather than the cache
+    benchmark(lambda: ee.emit(next(events), 42))
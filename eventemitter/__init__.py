@@ -1,5 +1,14 @@
-from eventemitter.eventemitter import AbstractEventEmitter, AsyncIOEventEmitter, EventEmitter
+from eventemitter.eventemitter import (
+    AbstractEventEmitter,
+    AsyncIOEventEmitter,
+    AsyncIOQueueEventEmitter,
+    EventEmitter,
+    MaxListenersExceededWarning,
+    ProcessPoolEventEmitter,
+    ThreadPoolEventEmitter,
+)
 from eventemitter.protocol import EventEmitterProtocol
+from eventemitter.streams import EventStream
 from eventemitter.types import AsyncListenable, Listenable
 
 __version__ = "1.0.13"
@@ -7,8 +16,13 @@ __version__ = "1.0.13"
 __all__ = [
     "AbstractEventEmitter",
     "AsyncIOEventEmitter",
+    "AsyncIOQueueEventEmitter",
     "AsyncListenable",
     "EventEmitter",
     "EventEmitterProtocol",
+    "EventStream",
     "Listenable",
+    "MaxListenersExceededWarning",
+    "ProcessPoolEventEmitter",
+    "ThreadPoolEventEmitter",
 ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import importlib
+import time
+from types import ModuleType
+from typing import Any, Iterable, List, Optional, Tuple
+
+# NumPy is optional, and only used to build columnar batches
+try:
+    numpy: Optional[ModuleType] = importlib.import_module("numpy")
+except ImportError:
+    numpy = None
+
+
+class BatchBuffer:
+    __slots__ = ("_deadline", "_payloads", "columnar", "max_delay", "max_size")
+
+    def __init__(
+        self, max_size: Optional[int] = None, max_delay: Optional[float] = None, columnar: bool = False
+    ) -> None:
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"Expected max_size to be at least 1 but got {max_size}")
+
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError(f"Expected max_delay to be positive but got {max_delay}")
+
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.columnar = columnar
+        self._payloads: List[Tuple[Any, ...]] = []
+        self._deadline: Optional[float] = None
+
+    @property
+    def buffered(self) -> bool:
+        return self.max_size is not None or self.max_delay is not None
+
+    @property
+    def pending(self) -> int:
+        return len(self._payloads)
+
+    @property
+    def deadline(self) -> Optional[float]:
+        # In terms of `time.monotonic()`, set while payloads are waiting for a time window to close
+        return self._deadline
+
+    def add(self, args: Tuple[Any, ...]) -> Optional[Any]:
+        # Returns a batch once the buffer is full or its time window has closed, `None` otherwise
+        if not self.buffered:
+            return self._format([args])
+
+        self._payloads.append(args)
+        if self.max_delay is not None and self._deadline is None:
+            self._deadline = time.monotonic() + self.max_delay
+
+        if self._is_due():
+            return self.take()
+
+        return None
+
+    def extend(self, payloads: Iterable[Tuple[Any, ...]]) -> List[Any]:
+        if not self.buffered:
+            payloads = list(payloads)
+            return [self._format(payloads)] if payloads else []
+
+        batches = []
+        for args in payloads:
+            batch = self.add(args)
+            if batch is not None:
+                batches.append(batch)
+
+        return batches
+
+    def take(self) -> Optional[Any]:
+        if not self._payloads:
+            return None
+
+        payloads, self._payloads = self._payloads, []
+        self._deadline = None
+        return self._format(payloads)
+
+    def _is_due(self) -> bool:
+        if self.max_size is not None and len(self._payloads) >= self.max_size:
+            return True
+
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _format(self, payloads: List[Tuple[Any, ...]]) -> Any:
+        if not self.columnar:
+            return payloads
+
+        return to_columns(payloads)
+
+
+def to_columns(payloads: List[Tuple[Any, ...]]) -> List[Any]:
+    # One column per positional argument, as a NumPy array if NumPy is installed
+    columns = zip(*payloads)
+    if numpy is None:
+        return [list(column) for column in columns]
+
+    return [numpy.asarray(column) for column in columns]
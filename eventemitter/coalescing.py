@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Optional, Tuple, cast
+
+Deliver = Callable[[Tuple[Any, ...], Dict[str, Any]], None]
+
+
+class Coalescer:
+    __slots__ = ("_handle", "_last", "_pending", "interval", "leading", "throttle", "trailing")
+
+    def __init__(self, interval: float, throttle: bool = False, leading: bool = False, trailing: bool = True) -> None:
+        if interval <= 0:
+            raise ValueError(f"Expected interval to be positive but got {interval}")
+
+        if not leading and not trailing:
+            raise ValueError("Expected at least one of leading and trailing to be enabled")
+
+        self.interval = interval
+        self.throttle = throttle
+        self.leading = leading
+        self.trailing = trailing
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._last: Optional[float] = None
+        self._pending: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+
+    def offer(self, args: Tuple[Any, ...], kwargs: Dict[str, Any], deliver: Deliver) -> bool:
+        # Returns `True` if the payload is to be delivered right away. Otherwise, it supersedes the pending payload,
+        # which is handed to `deliver` once the interval has passed
+        loop = asyncio.get_running_loop()
+        if self.throttle:
+            return self._throttle(loop, args, kwargs, deliver)
+        else:
+            return self._debounce(loop, args, kwargs, deliver)
+
+    def cancel(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        self._pending = None
+
+    def _debounce(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        deliver: Deliver,
+    ) -> bool:
+        # The first payload of a burst is leading, and the timer restarts on every payload until the burst is over
+        leading = self.leading and self._handle is None
+        if self._handle is not None:
+            self._handle.cancel()
+
+        self._handle = loop.call_later(self.interval, self._fire, loop, deliver)
+        self._pending = (args, kwargs) if self.trailing and not leading else None
+        return leading
+
+    def _throttle(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        deliver: Deliver,
+    ) -> bool:
+        now = loop.time()
+        idle = self._last is None or now - self._last >= self.interval
+
+        if self._handle is None and idle and self.leading:
+            self._last = now
+            return True
+
+        if self.trailing:
+            self._pending = (args, kwargs)
+            if self._handle is None:
+                delay = self.interval if idle else cast(float, self._last) + self.interval - now
+                self._handle = loop.call_later(delay, self._fire, loop, deliver)
+
+        return False
+
+    def _fire(self, loop: asyncio.AbstractEventLoop, deliver: Deliver) -> None:
+        self._handle = None
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+
+        self._last = loop.time()
+        deliver(*pending)
@@ -1,16 +1,49 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import functools
+import pickle
+import threading
+import time
+import warnings
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Generic, Hashable, List, Optional, Type, TypeVar, Union
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Self, overload
 
-from eventemitter.events import Events
+from eventemitter.batching import BatchBuffer
+from eventemitter.coalescing import Coalescer
+from eventemitter.events import Events, HierarchicalEvents, PatternEvents
 from eventemitter.handlers import AbstractHandler, AsyncHandler, Handler
 from eventemitter.protocol import EventEmitterProtocol
+from eventemitter.queues import OverflowPolicy, put, validate_overflow
+from eventemitter.streams import EventStream
 from eventemitter.types import AsyncListenable, Listenable, Returns
-from eventemitter.utils import run_coroutine
+from eventemitter.utils import call_listeners, caller_site, gather_bounded, gather_eagerly, run_coroutine
+from eventemitter.weak import unwrap, weaken
 
 L = TypeVar("L", bound=Union[Listenable, AsyncListenable])  # for classes
 H = TypeVar("H", bound=AbstractHandler)
@@ -18,6 +51,13 @@ H = TypeVar("H", bound=AbstractHandler)
 F = TypeVar("F", bound=Union[Listenable, AsyncListenable])  # for functions
 
 
+class MaxListenersExceededWarning(RuntimeWarning):
+    """The warning issued when more listeners than allowed are added for an event, which often means that listeners leak.
+
+    The warning points at where the listener that exceeded the maximum was added. See [`set_max_listeners()`][eventemitter.AbstractEventEmitter.set_max_listeners].
+    """
+
+
 # Reference: https://nodejs.org/api/events.html
 class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
     """An abstract class for `EventEmitter` classes.
@@ -26,21 +66,53 @@ class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
     All `EventEmitter`s emit the event `"new_listener"` when new listeners are added and `"remove_listener"` when existing listeners are removed.
     """
 
-    __slots__ = ("_events",)
+    __slots__ = ("_event_max_listeners", "_events", "_max_listeners", "_warned", "_weak")
 
     _handler_cls: Type[H]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    default_max_listeners: ClassVar[int] = 10
+
+    def __init__(
+        self,
+        *args: Any,
+        wildcard: bool = False,
+        delimiter: str = ".",
+        hierarchical: bool = False,
+        weak: bool = False,
+        **kwargs: Any,
+    ) -> None:
         """Initialize an instance of [`AbstractEventEmitter`][eventemitter.AbstractEventEmitter].
 
         Args:
             *args: Arbitrary positional arguments
+            wildcard: Whether event names that are strings may be patterns. A pattern is a name split by `delimiter` into segments, where a `"*"` segment matches exactly one segment and a `"**"` segment matches any number of them. The listeners of a pattern, such as `"order.*"` or `"**.failed"`, are called for every event whose name it matches, after the listeners of the event itself, including the `"new_listener"` and `"remove_listener"` events.
+            delimiter: The string that separates the segments of event names if `wildcard` is enabled
+            hierarchical: Whether events named by tuples bubble up to their ancestors. Emitting `("db", "users", "insert")` calls the listeners of the event itself, then those of `("db", "users")`, and then those of `("db",)`, as a single emit.
+            weak: Whether to hold listeners by weak references, so that registering a listener keeps neither it nor, for a bound method, its instance alive. The listeners that are gone are dropped, without a `"remove_listener"` event, the next time they would have been called. Listeners that nothing else refers to, such as lambdas, are gone right away.
             **kwargs: Arbitrary keyword arguments
+
+        Raises:
+            ValueError: If `delimiter` is empty, or if both `wildcard` and `hierarchical` are enabled.
         """
+        if wildcard and hierarchical:
+            raise ValueError("Expected at most one of wildcard and hierarchical to be enabled")
+
         # To support cooperative multiple inheritance
         # Reference: https://rhettinger.wordpress.com/2011/05/26/super-considered-super/
         super().__init__(*args, **kwargs)
-        self._events: Events[L, H] = Events[L, H]()
+
+        self._events: Events[L, H]
+        if wildcard:
+            self._events = PatternEvents[L, H](delimiter)
+        elif hierarchical:
+            self._events = HierarchicalEvents[L, H]()
+        else:
+            self._events = Events[L, H]()
+
+        self._weak = weak
+        self._max_listeners = self.default_max_listeners
+        self._event_max_listeners: Dict[Hashable, int] = {}
+        self._warned: Set[Hashable] = set()
 
     def add_listener(self, event: Hashable, listener: L) -> Self:
         """Add the `listener` function to the end of the listeners list for the event named `event`. Multiple calls passing the same combination of `event` and `listener` will result in the `listener` being added, and called, multiple times.
@@ -100,9 +172,81 @@ class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
         """
         return list(self._events.keys())
 
+    def get_max_listeners(self, event: Optional[Hashable] = None) -> int:
+        """Return the maximum number of listeners for the event named `event`, or the maximum for all events if `event` is `None`.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            The maximum number of listeners, or `0` if there is no limit.
+        """
+        if event is None:
+            return self._max_listeners
+
+        return self._event_max_listeners.get(event, self._max_listeners)
+
+    def has_listeners(self, event: Optional[Hashable] = None) -> bool:
+        """Return whether the emitter has listeners for the event named `event`, or for any event if `event` is `None`.
+
+        Notes:
+            - As with `listener_count()`, a listener held by a weak reference is counted until it is dropped, even if it is already gone.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            `True` if there are listeners, `False` otherwise.
+        """
+        return self.listener_count(event) > 0
+
+    def iter_events(self) -> Iterator[Hashable]:
+        """Return an iterator over the events for which the emitter has registered listeners, without copying them as `events()` does.
+
+        Notes:
+            - Adding or removing listeners while iterating raises `RuntimeError`, as changing a `dict` does.
+
+        Returns:
+            An iterator over the `event`s
+        """
+        return iter(self._events.keys())
+
+    def iter_listeners(self, event: Hashable) -> Iterator[L]:
+        """Return an iterator over the listeners for the event named `event`, without copying them as `listeners()` does.
+
+        The iterator goes over the listeners as they were when it was created, even if listeners are added or removed while iterating.
+        Listeners held by weak references that are already gone are skipped.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            An iterator over the listeners for the event named `event`.
+        """
+        return self._events.iter_listeners(event)
+
+    def listener_count(self, event: Optional[Hashable] = None) -> int:
+        """Return the number of listeners for the event named `event`, or for all events if `event` is `None`, without copying them.
+
+        Notes:
+            - The listeners are counted as they are registered. A listener held by a weak reference is counted until it is dropped, the next time it would have been called, even if it is already gone, whereas `listeners()` leaves it out.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            The number of listeners.
+        """
+        if event is None:
+            return self._events.total
+
+        return self._events.count(event)
+
     def listeners(self, event: Hashable) -> List[L]:
         """Return a copy of the list of listeners for the event named `event`.
 
+        Listeners held by weak references that are already gone are left out.
+
         Args:
             event: The name of the event
 
@@ -175,6 +319,75 @@ class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
 
         return decorator if listener is None else self
 
+    @overload
+    def on_batch(
+        self,
+        event: Hashable,
+        listener: L,
+        *,
+        max_size: Optional[int] = None,
+        max_delay: Optional[float] = None,
+        columnar: bool = False,
+    ) -> Self: ...
+    @overload
+    def on_batch(
+        self,
+        event: Hashable,
+        *,
+        max_size: Optional[int] = None,
+        max_delay: Optional[float] = None,
+        columnar: bool = False,
+    ) -> Callable[[F], F]: ...
+
+    def on_batch(
+        self,
+        event: Hashable,
+        listener: Optional[F] = None,
+        *,
+        max_size: Optional[int] = None,
+        max_delay: Optional[float] = None,
+        columnar: bool = False,
+    ) -> Union[Self, Callable[[F], F]]:
+        """Add a **batch** `listener` function to the end of the listeners list for the event named `event` if a `listener` is provided, or return a decorator that adds the decorated function as a **batch** `listener` if no `listener` is provided.
+
+        Instead of being called once per payload, a batch listener is called with a list of the positional arguments of many payloads, so that it can process them at once.
+        By default, `emit_many()` calls it once with all the payloads and `emit()` calls it with a list of a single payload.
+        If `max_size` or `max_delay` is set, the payloads are buffered instead, and the listener is called once `max_size` payloads have been buffered or once `max_delay` seconds have passed since the first of them.
+        Buffered payloads can be delivered early with `flush()`.
+
+        The keyword arguments of the emit that completes a batch are passed to the listener as they are. Listeners called by `flush()` get none.
+
+        Notes:
+            - `EventEmitter` checks whether `max_delay` has passed only when the event is emitted again, while `AsyncIOEventEmitter` also schedules the delivery on the running event loop.
+            - Buffered payloads are dropped when the listener is removed.
+
+        Args:
+            event: The name of the event
+            listener: The callback function
+            max_size: The number of payloads to buffer before calling the listener
+            max_delay: The number of seconds to buffer payloads for before calling the listener
+            columnar: Whether to pass a list of columns, one per positional argument, instead of a list of payloads. The columns are NumPy arrays if [NumPy](https://numpy.org) is installed, and lists otherwise.
+
+        Returns:
+            (Self): An instance of the `EventEmitter`, so that calls can be chained if a `listener` is provided.
+            (Callable[[F], F]): A decorator that adds the decorated function as a **batch** `listener` for the event named `event` if no `listener` is provided.
+
+        Raises:
+            ValueError: If `max_size` is less than 1 or `max_delay` is not positive.
+        """
+        # Validate now rather than when the decorator is applied
+        BatchBuffer(max_size, max_delay, columnar)
+
+        def decorator(listener: F) -> F:
+            batch = BatchBuffer(max_size, max_delay, columnar)
+            self._append_handler(event, self._handler_cls.from_func(listener, batch=batch))
+            return listener
+
+        if listener is not None:
+            decorator(listener)
+
+        return decorator if listener is None else self
+
     def remove_all_listeners(self, event: Optional[Hashable] = None) -> Self:
         """Remove all listeners, or those of the specified `event`.
 
@@ -187,6 +400,10 @@ class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
         if event is None:
             for event in self.events():
                 self.remove_all_listeners(event)
+        elif self._events.get("remove_listener") is None:
+            # Nobody observes the individual removals, so the event can be cleared in one step
+            if event in self._events:
+                self._delete_event(event)
         else:
             for handler in reversed(self._events.handlers(event)):
                 self._remove_handler(event, handler)
@@ -214,16 +431,79 @@ class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
         """
         return self._remove_handler(event, listener)
 
+    def set_max_listeners(self, n: int, event: Optional[Hashable] = None) -> Self:
+        """Set the maximum number of listeners for the event named `event`, or for all events that have no maximum of their own if `event` is `None`.
+
+        Adding more listeners than the maximum for an event issues a [`MaxListenersExceededWarning`][eventemitter.MaxListenersExceededWarning], once per event, to help find listeners that leak. The listeners are added all the same.
+        The maximum for all events starts at `default_max_listeners`, which is `10`.
+
+        Args:
+            n: The maximum number of listeners, or `0` for no limit
+            event: The name of the event
+
+        Returns:
+            An instance of the `EventEmitter`, so that calls can be chained.
+
+        Raises:
+            ValueError: If `n` is negative.
+        """
+        if n < 0:
+            raise ValueError(f"Expected n to be at least 0 but got {n}")
+
+        if event is None:
+            self._max_listeners = n
+        else:
+            self._event_max_listeners[event] = n
+
+        return self
+
     def _append_handler(self, event: Hashable, handler: H) -> Self:
-        self._emit_until_complete("new_listener", event, handler.func)
-        self._events[event].append(handler)
+        if self._events.get("new_listener") is not None:
+            self._emit_until_complete("new_listener", event, handler.func)
+
+        if self._weak:
+            self._weaken(event, handler)
+
+        handlers = self._events[event]
+        handlers.append(handler)
+        self._check_max_listeners(event, len(handlers))
         return self
 
     def _prepend_handler(self, event: Hashable, handler: H) -> Self:
-        self._emit_until_complete("new_listener", event, handler.func)
-        self._events[event].prepend(handler)
+        if self._events.get("new_listener") is not None:
+            self._emit_until_complete("new_listener", event, handler.func)
+
+        if self._weak:
+            self._weaken(event, handler)
+
+        handlers = self._events[event]
+        handlers.prepend(handler)
+        self._check_max_listeners(event, len(handlers))
         return self
 
+    def _check_max_listeners(self, event: Hashable, count: int) -> None:
+        limit = self._event_max_listeners.get(event, self._max_listeners)
+        if not limit or count <= limit or event in self._warned:
+            return
+
+        self._warned.add(event)
+
+        # Points at the code that added the listener, however deep in the emitter it has been called from
+        filename, lineno, module = caller_site()
+        warnings.warn_explicit(
+            f"Possible listener leak: {count} listeners added for {event!r} to {type(self).__name__}, "
+            f"more than the maximum of {limit}. Use set_max_listeners() to raise it",
+            MaxListenersExceededWarning,
+            filename,
+            lineno,
+            module=module,
+        )
+
+    def _delete_event(self, event: Hashable) -> None:
+        # Once the event has no listeners, a leak of its listeners starting over is warned about again
+        del self._events[event]
+        self._warned.discard(event)
+
     @overload
     def _remove_handler(self, event: Hashable, target: H) -> Self: ...
     @overload
@@ -239,15 +519,77 @@ class AbstractEventEmitter(ABC, EventEmitterProtocol[L], Generic[L, H]):
             else:
                 handler = self._events[event].remove_by_id(target, last=True)
 
-            self._emit_until_complete("remove_listener", event, handler.func)
+            if self._events.get("remove_listener") is not None:
+                self._emit_until_complete("remove_listener", event, unwrap(handler.func))
         except ValueError:
             pass
 
         if not self._events[event]:
-            del self._events[event]
+            self._delete_event(event)
 
         return self
 
+    def _remove_once_handler(self, event: Hashable, handler: H) -> None:
+        # A lighter `_remove_handler()` for one-time handlers fired by `emit()`, which already holds the handler itself.
+        # The handler may have been registered for a pattern that `event` matches rather than for `event` itself
+        name = self._events.source(event, handler)
+        if name is None:
+            # Already removed by a listener called earlier in the same emit
+            return
+
+        handlers = self._events[name]
+        handlers.remove(handler)
+
+        if self._events.get("remove_listener") is not None:
+            self._emit_until_complete("remove_listener", name, unwrap(handler.func))
+
+        if name in self._events and not self._events.handlers(name):
+            self._delete_event(name)
+
+    def _weaken(self, event: Hashable, handler: H) -> None:
+        # The handler keeps the listener by a weak reference. The listener reports when it is found gone, instead of
+        # every emit checking for listeners that are gone
+        handler.func = weaken(handler.func, functools.partial(_prune_dead, weakref.ref(self), event))
+
+    def _prune(self, event: Hashable) -> None:
+        # Drops the listeners of `event` that were held by weak references and are gone
+        if event not in self._events:
+            return
+
+        handlers = self._events[event]
+        for handler in handlers.snapshot:
+            if unwrap(handler.func) is None:
+                handlers.remove(handler)
+
+        if not handlers:
+            self._delete_event(event)
+
+    def _take_batches(self, event: Optional[Hashable]) -> List[Tuple[Hashable, H, Any]]:
+        # The payloads buffered by the batch listeners of `event`, or of every event
+        events = self.events() if event is None else [event]
+
+        batches = []
+        for name in events:
+            for handler in self._events.handlers(name):
+                if handler.batch is None:
+                    continue
+
+                batch = handler.batch.take()
+                if batch is not None:
+                    batches.append((name, handler, batch))
+
+        return batches
+
+    @staticmethod
+    def _partition(handlers: Sequence[H]) -> Tuple[List[H], List[H]]:
+        # Splits the handlers of `emit_many()` into those called once per payload and those called once per batch
+        per_payload: List[H] = []
+        per_batch: List[H] = []
+        for handler in handlers:
+            (per_payload if handler.batch is None else per_batch).append(handler)
+
+        return per_payload, per_batch
+
     @abstractmethod
     def _emit_until_complete(self, event: Hashable, *args: Any, **kwargs: Any) -> None: ...
 
@@ -304,17 +646,86 @@ class EventEmitter(AbstractEventEmitter[Listenable, Handler]):
         Returns:
             (bool): `True` if the `event` had listeners, `False` otherwise.
         """
-        if event not in self._events:
+        handlers = self._events.get(event)
+        if handlers is None:
             return False
 
-        for handler in self._events.handlers(event):
-            if handler.once:
-                self._remove_handler(event, handler)
+        if not handlers.has_once and not handlers.has_batch:
+            for handler in handlers.snapshot:
+                handler.func(*args, **kwargs)
+        else:
+            for handler in handlers.snapshot:
+                if handler.once:
+                    self._remove_once_handler(event, handler)
+
+                if handler.batch is None:
+                    handler.func(*args, **kwargs)
+                else:
+                    batch = handler.batch.add(args)
+                    if batch is not None:
+                        handler.func(batch, **kwargs)
+
+        return True
+
+    def emit_many(self, event: Hashable, iterable_of_args: Iterable[Tuple[Any, ...]], **kwargs: Any) -> bool:
+        """Call each of the listeners registered for the event named `event` once per payload, passing the positional arguments of the payload and the supplied keyword arguments to each.
 
-            handler(*args, **kwargs)
+        This works like calling `emit()` for each payload in turn, except that the listeners are looked up only once.
+        One-time listeners are called for the first payload only. Batch listeners, added with `on_batch()`, are called once, after all the other listeners, with the list of all the payloads.
+
+        Args:
+            event: The name of the event
+            iterable_of_args: The positional arguments of each payload
+            **kwargs: Arbitrary keyword arguments, passed along with every payload
+
+        Returns:
+            (bool): `True` if the `event` had listeners, `False` otherwise.
+        """
+        handlers = self._events.get(event)
+        if handlers is None:
+            return False
+
+        if not handlers.has_once and not handlers.has_batch:
+            snapshot = handlers.snapshot
+            for args in iterable_of_args:
+                for handler in snapshot:
+                    handler.func(*args, **kwargs)
+
+            return True
+
+        per_payload, per_batch = self._partition(handlers.snapshot)
+        once = any(handler.once for handler in per_payload)
+        batch: List[Tuple[Any, ...]] = []
+
+        for args in iterable_of_args:
+            if per_batch:
+                batch.append(args)
+
+            for handler in per_payload:
+                if handler.once:
+                    self._remove_once_handler(event, handler)
+
+                handler.func(*args, **kwargs)
+
+            if once:
+                per_payload = [handler for handler in per_payload if not handler.once]
+                once = False
+
+        for handler in per_batch:
+            for payloads in cast(BatchBuffer, handler.batch).extend(batch):
+                handler.func(payloads, **kwargs)
 
         return True
 
+    def flush(self, event: Optional[Hashable] = None) -> None:
+        """Call the batch listeners of the event named `event`, or of every event, with the payloads they have buffered.
+
+        Args:
+            event: The name of the event
+        """
+        for _, handler, batch in self._take_batches(event):
+            handler.func(batch)
+
     def _emit_until_complete(self, event: Hashable, *args: Any, **kwargs: Any) -> None:
         self.emit(event, *args, **kwargs)
 
@@ -357,18 +768,41 @@ class AsyncIOEventEmitter(AbstractEventEmitter[Union[Listenable, AsyncListenable
 
     _handler_cls = AsyncHandler
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        eager: bool = False,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize an instance of `AsyncIOEventEmitter`.
 
         Args:
             *args: Arbitrary positional arguments
+            eager: Whether to start the coroutines of asynchronous listeners eagerly in `emit()`. An eagerly started listener runs until its first suspension before it is scheduled on the event loop, so listeners that complete without suspending skip the event loop entirely. Requires Python 3.12 or later, and is ignored on earlier versions.
+            max_concurrency: The maximum number of asynchronous listeners that `emit()` runs at the same time for a single event, or `None` to run all of them at once. Synchronous listeners are not counted, as they are called one by one anyway.
             **kwargs: Arbitrary keyword arguments
+
+        Raises:
+            ValueError: If `max_concurrency` is less than 1.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"Expected max_concurrency to be at least 1 but got {max_concurrency}")
+
         super().__init__(*args, **kwargs)
+        self._eager = eager
+        self._max_concurrency = max_concurrency
+        self._coalescers: Dict[Hashable, Coalescer] = {}
+        self._waiters: Dict[Hashable, Dict[asyncio.Future[Tuple[Any, ...]], Optional[Callable[..., bool]]]] = {}
+        self._background: Set[asyncio.Future[None]] = set()
 
     async def emit(self, event: Hashable, *args: Any, **kwargs: Any) -> bool:
         """Call each of the listeners registered for the event named `event`, simultaneously, passing the supplied arguments to each.
 
+        Synchronous listeners are called right away, in the order they were registered, and the coroutines of asynchronous listeners are then awaited concurrently, at most `max_concurrency` at a time if it has been set.
+        If a listener raises an exception, the other listeners still run, and the first exception is raised, that of a synchronous listener first.
+        As with [`asyncio.gather()`][asyncio.gather], it is raised as soon as an asynchronous listener fails, while the other coroutines keep running, unless they are limited by `max_concurrency`, in which case it is raised once they have completed.
+
         Args:
             event: The name of the event
             *args: Arbitrary positional arguments
@@ -377,20 +811,387 @@ class AsyncIOEventEmitter(AbstractEventEmitter[Union[Listenable, AsyncListenable
         Returns:
             (bool): `True` if the `event` had listeners, `False` otherwise.
         """
-        if event not in self._events:
+        if event in self._waiters:
+            self._resolve_waiters(event, args, kwargs)
+
+        return await self._emit_to_listeners(event, args, kwargs)
+
+    async def _emit_to_listeners(self, event: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+        # `emit()` without resolving the waiters, for emits whose waiters have been resolved already
+        handlers = self._events.get(event)
+        if handlers is None:
             return False
 
-        tasks = set()
-        for handler in self._events.handlers(event):
-            if handler.once:
-                self._remove_handler(event, handler)
+        if self._coalescers and event in self._coalescers and not self._offer(event, args, kwargs):
+            return True  # Held back, and superseded by a later emit or delivered once the interval has passed
+
+        special = handlers.has_batch or handlers.has_coalesced
+        await self._dispatch(event, handlers.snapshot, handlers.has_once, special, args, kwargs)
+        return True
+
+    async def emit_many(self, event: Hashable, iterable_of_args: Iterable[Tuple[Any, ...]], **kwargs: Any) -> bool:
+        """Call each of the listeners registered for the event named `event` once per payload, passing the positional arguments of the payload and the supplied keyword arguments to each.
+
+        This works like awaiting `emit()` for each payload in turn, except that the listeners are looked up only once.
+        One-time listeners are called for the first payload only. Batch listeners, added with `on_batch()`, are called once, after all the other listeners, with the list of all the payloads.
+        If a listener raises an exception, the payloads that follow are not dispatched.
+
+        Args:
+            event: The name of the event
+            iterable_of_args: The positional arguments of each payload
+            **kwargs: Arbitrary keyword arguments, passed along with every payload
+
+        Returns:
+            (bool): `True` if the `event` had listeners, `False` otherwise.
+        """
+        handlers = self._events.get(event)
+        if handlers is not None and event in self._coalescers:
+            # Each payload may supersede the previous one, so they go through `emit()` one by one
+            for args in iterable_of_args:
+                await self.emit(event, *args, **kwargs)
+
+            return True
+
+        if event in self._waiters:
+            iterable_of_args = list(iterable_of_args)
+            for args in iterable_of_args:
+                if event not in self._waiters:
+                    break  # Every waiter has been resolved
 
-            tasks.add(handler(*args, **kwargs))
+                self._resolve_waiters(event, args, kwargs)
 
-        await asyncio.gather(*tasks)
+        if handlers is None:
+            return False
+
+        per_payload, per_batch = self._partition(handlers.snapshot)
+        once = any(handler.once for handler in per_payload)
+        coalesced = handlers.has_coalesced
+        batch: List[Tuple[Any, ...]] = []
+
+        for args in iterable_of_args:
+            if per_batch:
+                batch.append(args)
+
+            await self._dispatch(event, per_payload, once, coalesced, args, kwargs)
+
+            if once:
+                per_payload = [handler for handler in per_payload if not handler.once]
+                once = False
+
+        for handler in per_batch:
+            for payloads in self._add_to_batch(event, handler, batch):
+                await self._dispatch(event, [handler], False, False, (payloads,), kwargs)
 
         return True
 
+    async def flush(self, event: Optional[Hashable] = None) -> None:
+        """Call the batch listeners of the event named `event`, or of every event, with the payloads they have buffered.
+
+        Args:
+            event: The name of the event
+        """
+        for name, handler, batch in self._take_batches(event):
+            await self._dispatch(name, [handler], False, False, (batch,), {})
+
+    def stream(self, event: Hashable, *, maxsize: int = 1000, overflow: OverflowPolicy = "block") -> EventStream:
+        """Return an asynchronous iterator over the emits of the event named `event`, from now on.
+
+        The positional arguments of each emit are buffered until they are consumed, by `async for` or by [`next_batch()`][eventemitter.EventStream.next_batch] to drain many at once.
+        When the buffer is full, the `overflow` policy applies: `"block"` makes `emit()` wait until the buffer has room, `"drop_oldest"` and `"drop_newest"` drop an emit, and `"raise"` makes `emit()` raise [`asyncio.QueueFull`][asyncio.QueueFull].
+        Closing the stream, with `aclose()` or by leaving `async with`, removes its listener with `remove_listener()`.
+
+        Args:
+            event: The name of the event
+            maxsize: The maximum number of emits buffered until they are consumed
+            overflow: What happens when the buffer is full: `"block"`, `"drop_oldest"`, `"drop_newest"` or `"raise"`
+
+        Returns:
+            An [`EventStream`][eventemitter.EventStream] over the emits of the event.
+
+        Raises:
+            ValueError: If `maxsize` is less than 1 or `overflow` is not a known policy.
+        """
+        return EventStream(self, event, maxsize=maxsize, overflow=overflow)
+
+    async def wait_for(
+        self,
+        event: Hashable,
+        predicate: Optional[Callable[..., bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, ...]:
+        """Wait until the event named `event` is emitted, and return the positional arguments of the emit.
+
+        No listener is added for the wait, so neither `"new_listener"` nor `"remove_listener"` events are emitted, and all the waits for an event are resolved together when it is emitted.
+        The wait is dropped as soon as it is resolved, times out or is cancelled.
+
+        Args:
+            event: The name of the event
+            predicate: A function called with the arguments of each emit, returning whether it is the emit to wait for, or `None` to wait for any emit
+            timeout: The maximum number of seconds to wait, or `None` to wait indefinitely
+
+        Returns:
+            The positional arguments of the emit.
+
+        Raises:
+            asyncio.TimeoutError: If `timeout` has passed before the event was emitted.
+        """
+        future: asyncio.Future[Tuple[Any, ...]] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(event, {})[future] = predicate
+
+        try:
+            if timeout is None:
+                return await future
+
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            future.cancel()
+
+            waiters = self._waiters.get(event)
+            if waiters is not None:
+                waiters.pop(future, None)
+                if not waiters:
+                    del self._waiters[event]
+
+    @overload
+    def on_debounced(
+        self,
+        event: Hashable,
+        listener: F,
+        *,
+        wait: float,
+        leading: bool = False,
+        trailing: bool = True,
+    ) -> Self: ...
+    @overload
+    def on_debounced(
+        self,
+        event: Hashable,
+        *,
+        wait: float,
+        leading: bool = False,
+        trailing: bool = True,
+    ) -> Callable[[F], F]: ...
+
+    def on_debounced(
+        self,
+        event: Hashable,
+        listener: Optional[F] = None,
+        *,
+        wait: float,
+        leading: bool = False,
+        trailing: bool = True,
+    ) -> Union[Self, Callable[[F], F]]:
+        """Add a **debounced** `listener` function to the end of the listeners list for the event named `event` if a `listener` is provided, or return a decorator that adds the decorated function as a **debounced** `listener` if no `listener` is provided.
+
+        A debounced listener is called once per burst of emits, that is, emits less than `wait` seconds apart from each other.
+        It is called with the arguments of the first emit of the burst if `leading` is set, and with those of the last one, `wait` seconds after it, if `trailing` is set. The other emits are superseded and never reach the listener.
+
+        Notes:
+            - A trailing call is made from the event loop rather than from `emit()`, so its exceptions are reported by the event loop, not raised.
+
+        Args:
+            event: The name of the event
+            listener: The callback function
+            wait: The number of seconds without emits that ends a burst
+            leading: Whether to call the listener at the start of a burst
+            trailing: Whether to call the listener at the end of a burst
+
+        Returns:
+            (Self): An instance of the `EventEmitter`, so that calls can be chained if a `listener` is provided.
+            (Callable[[F], F]): A decorator that adds the decorated function as a **debounced** `listener` for the event named `event` if no `listener` is provided.
+
+        Raises:
+            ValueError: If `wait` is not positive, or neither `leading` nor `trailing` is set.
+        """
+        return self._on_coalesced(event, listener, wait, False, leading, trailing)
+
+    @overload
+    def on_throttled(
+        self,
+        event: Hashable,
+        listener: F,
+        *,
+        interval: float,
+        leading: bool = True,
+        trailing: bool = True,
+    ) -> Self: ...
+    @overload
+    def on_throttled(
+        self,
+        event: Hashable,
+        *,
+        interval: float,
+        leading: bool = True,
+        trailing: bool = True,
+    ) -> Callable[[F], F]: ...
+
+    def on_throttled(
+        self,
+        event: Hashable,
+        listener: Optional[F] = None,
+        *,
+        interval: float,
+        leading: bool = True,
+        trailing: bool = True,
+    ) -> Union[Self, Callable[[F], F]]:
+        """Add a **throttled** `listener` function to the end of the listeners list for the event named `event` if a `listener` is provided, or return a decorator that adds the decorated function as a **throttled** `listener` if no `listener` is provided.
+
+        A throttled listener is called at most once every `interval` seconds.
+        If `leading` is set, an emit after a quiet `interval` reaches the listener right away. If `trailing` is set, the last of the emits held back in the meantime reaches it once the `interval` has passed. The other emits are superseded and never reach the listener.
+
+        Notes:
+            - A trailing call is made from the event loop rather than from `emit()`, so its exceptions are reported by the event loop, not raised.
+
+        Args:
+            event: The name of the event
+            listener: The callback function
+            interval: The minimum number of seconds between two calls of the listener
+            leading: Whether to call the listener right away after a quiet `interval`
+            trailing: Whether to call the listener with the last emit held back once the `interval` has passed
+
+        Returns:
+            (Self): An instance of the `EventEmitter`, so that calls can be chained if a `listener` is provided.
+            (Callable[[F], F]): A decorator that adds the decorated function as a **throttled** `listener` for the event named `event` if no `listener` is provided.
+
+        Raises:
+            ValueError: If `interval` is not positive, or neither `leading` nor `trailing` is set.
+        """
+        return self._on_coalesced(event, listener, interval, True, leading, trailing)
+
+    def set_debounce(self, event: Hashable, wait: float, *, leading: bool = False, trailing: bool = True) -> Self:
+        """Debounce the event named `event` as a whole, so that all of its listeners are called once per burst of emits. See `on_debounced()` for the meaning of the arguments.
+
+        Args:
+            event: The name of the event
+            wait: The number of seconds without emits that ends a burst
+            leading: Whether to emit at the start of a burst
+            trailing: Whether to emit at the end of a burst
+
+        Returns:
+            An instance of the `EventEmitter`, so that calls can be chained.
+
+        Raises:
+            ValueError: If `wait` is not positive, or neither `leading` nor `trailing` is set.
+        """
+        return self._set_coalescer(event, Coalescer(wait, throttle=False, leading=leading, trailing=trailing))
+
+    def set_throttle(self, event: Hashable, interval: float, *, leading: bool = True, trailing: bool = True) -> Self:
+        """Throttle the event named `event` as a whole, so that its listeners are called at most once every `interval` seconds. See `on_throttled()` for the meaning of the arguments.
+
+        Args:
+            event: The name of the event
+            interval: The minimum number of seconds between two emits
+            leading: Whether to emit right away after a quiet `interval`
+            trailing: Whether to emit the last emit held back once the `interval` has passed
+
+        Returns:
+            An instance of the `EventEmitter`, so that calls can be chained.
+
+        Raises:
+            ValueError: If `interval` is not positive, or neither `leading` nor `trailing` is set.
+        """
+        return self._set_coalescer(event, Coalescer(interval, throttle=True, leading=leading, trailing=trailing))
+
+    def clear_coalescing(self, event: Hashable) -> Self:
+        """Stop debouncing or throttling the event named `event` as a whole. An emit held back is dropped.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            An instance of the `EventEmitter`, so that calls can be chained.
+        """
+        coalescer = self._coalescers.pop(event, None)
+        if coalescer is not None:
+            coalescer.cancel()
+
+        return self
+
+    def _on_coalesced(
+        self,
+        event: Hashable,
+        listener: Optional[F],
+        interval: float,
+        throttle: bool,
+        leading: bool,
+        trailing: bool,
+    ) -> Union[Self, Callable[[F], F]]:
+        # Validate now rather than when the decorator is applied
+        Coalescer(interval, throttle, leading, trailing)
+
+        def decorator(listener: F) -> F:
+            coalescer = Coalescer(interval, throttle, leading, trailing)
+            self._append_handler(event, self._handler_cls.from_func(listener, coalescer=coalescer))
+            return listener
+
+        if listener is not None:
+            decorator(listener)
+
+        return decorator if listener is None else self
+
+    def _set_coalescer(self, event: Hashable, coalescer: Coalescer) -> Self:
+        self.clear_coalescing(event)
+        self._coalescers[event] = coalescer
+        return self
+
+    async def _dispatch(
+        self,
+        event: Hashable,
+        handlers: Sequence[AsyncHandler],
+        once: bool,
+        special: bool,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        # `special` tells whether any of the handlers is a batch or coalesced one
+        coroutines: List[Coroutine[Any, Any, None]] = []
+        error: Optional[Exception] = None
+
+        for handler in handlers:
+            if once and handler.once:
+                self._remove_once_handler(event, handler)
+
+            call_args = args
+            if special:
+                if handler.coalescer is not None and not self._offer_to_listener(event, handler, args, kwargs):
+                    continue
+
+                if handler.batch is not None:
+                    payloads = self._add_to_batch(event, handler, [args])
+                    if not payloads:
+                        continue
+
+                    call_args = (payloads[0],)
+
+            if handler.is_coroutine:
+                coroutines.append(cast(AsyncListenable, handler.func)(*call_args, **kwargs))
+                continue
+
+            # Synchronous listeners have nothing to await, so they are called right away instead of being scheduled
+            try:
+                handler.func(*call_args, **kwargs)
+            except Exception as exception:  # noqa: BLE001 - Raised after the other listeners have been called
+                # As `asyncio.gather()` does, let the other listeners run and raise the first error afterwards
+                if error is None:
+                    error = exception
+
+        if coroutines:
+            try:
+                if len(coroutines) == 1:
+                    await coroutines[0]
+                elif self._max_concurrency is not None and len(coroutines) > self._max_concurrency:
+                    await gather_bounded(coroutines, self._max_concurrency, eager=self._eager)
+                elif self._eager:
+                    await gather_eagerly(*coroutines)
+                else:
+                    await asyncio.gather(*coroutines)
+            except Exception:
+                if error is None:
+                    raise
+
+        if error is not None:
+            raise error
+
     async def emit_in_order(self, event: Hashable, *args: Any, **kwargs: Any) -> bool:
         """Call each of the listeners registered for the event named `event`, in the order they were registered, passing the supplied arguments to each.
 
@@ -402,16 +1203,764 @@ class AsyncIOEventEmitter(AbstractEventEmitter[Union[Listenable, AsyncListenable
         Returns:
             (bool): `True` if the `event` had listeners, `False` otherwise.
         """
-        if event not in self._events:
+        if event in self._waiters:
+            self._resolve_waiters(event, args, kwargs)
+
+        handlers = self._events.get(event)
+        if handlers is None:
             return False
 
-        for handler in self._events.handlers(event):
+        if self._coalescers and event in self._coalescers and not self._offer(event, args, kwargs):
+            return True
+
+        once = handlers.has_once
+        special = handlers.has_batch or handlers.has_coalesced
+        for handler in handlers.snapshot:
+            if once and handler.once:
+                self._remove_once_handler(event, handler)
+
+            if special and handler.coalescer is not None and not self._offer_to_listener(event, handler, args, kwargs):
+                continue
+
+            if special and handler.batch is not None:
+                for payloads in self._add_to_batch(event, handler, [args]):
+                    await self._dispatch(event, [handler], False, False, (payloads,), kwargs)
+            elif handler.is_coroutine:
+                await cast(AsyncListenable, handler.func)(*args, **kwargs)
+            else:
+                handler.func(*args, **kwargs)
+
+        return True
+
+    def _emit_until_complete(self, event: Hashable, *args: Any, **kwargs: Any) -> None:
+        if self._needs_event_loop(event):
+            run_coroutine(self.emit, event, *args, **kwargs)
+            return
+
+        handlers = self._events.get(event)
+
+        if event in self._waiters:
+            self._resolve_waiters(event, args, kwargs)
+
+        if handlers is None:
+            return
+
+        # Without asynchronous listeners there is nothing to wait for, so the helper event loop is not needed
+        for handler in handlers.snapshot:
             if handler.once:
-                self._remove_handler(event, handler)
+                self._remove_once_handler(event, handler)
+
+            if handler.batch is None:
+                handler.func(*args, **kwargs)
+            else:
+                for payloads in self._add_to_batch(event, handler, [args]):
+                    handler.func(payloads, **kwargs)
+
+    def _needs_event_loop(self, event: Hashable) -> bool:
+        # Whether emitting `event` has to wait on the helper event loop, rather than only call listeners
+        handlers = self._events.get(event)
+        return handlers is not None and (
+            event in self._coalescers
+            or any(handler.is_coroutine or handler.coalescer is not None for handler in handlers.snapshot)
+        )
+
+    def _add_to_batch(self, event: Hashable, handler: AsyncHandler, payloads: List[Tuple[Any, ...]]) -> List[Any]:
+        buffer = cast(BatchBuffer, handler.batch)
+
+        deadline = buffer.deadline
+        batches = buffer.extend(payloads)
+        if buffer.deadline is not None and buffer.deadline != deadline:
+            self._schedule_flush(event, handler, buffer.deadline)
+
+        return batches
+
+    def _schedule_flush(self, event: Hashable, handler: AsyncHandler, deadline: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without a running event loop, the time window is only checked when the event is emitted again
+            return
+
+        loop.call_later(deadline - time.monotonic(), self._flush_due, event, handler, deadline)
+
+    def _flush_due(self, event: Hashable, handler: AsyncHandler, deadline: float) -> None:
+        buffer = cast(BatchBuffer, handler.batch)
+        if buffer.deadline != deadline or handler not in (self._events.get(event) or ()):
+            return  # Delivered or removed in the meantime
+
+        batch = buffer.take()
+        self._spawn(self._dispatch(event, [handler], False, False, (batch,), {}))
+
+    def _offer(self, event: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bool:
+        return self._coalescers[event].offer(args, kwargs, functools.partial(self._deliver, event))
+
+    def _deliver(self, event: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        self._spawn(self._emit_coalesced(event, args, kwargs))
+
+    async def _emit_coalesced(self, event: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        handlers = self._events.get(event)
+        if handlers is None:
+            return
+
+        special = handlers.has_batch or handlers.has_coalesced
+        await self._dispatch(event, handlers.snapshot, handlers.has_once, special, args, kwargs)
+
+    def _offer_to_listener(
+        self,
+        event: Hashable,
+        handler: AsyncHandler,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        coalescer = cast(Coalescer, handler.coalescer)
+        return coalescer.offer(args, kwargs, functools.partial(self._deliver_to_listener, event, handler))
+
+    def _deliver_to_listener(
+        self,
+        event: Hashable,
+        handler: AsyncHandler,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        if handler in (self._events.get(event) or ()):
+            self._spawn(self._dispatch(event, [handler], False, False, args, kwargs))
+
+    def _resolve_waiters(self, event: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        waiters = self._waiters[event]
+        resolved: List[Tuple[asyncio.Future[Tuple[Any, ...]], Optional[Exception]]] = []
+        for future, predicate in list(waiters.items()):
+            if future.done():
+                del waiters[future]  # Timed out or cancelled, but `wait_for()` has not resumed yet
+                continue
+
+            try:
+                if predicate is not None and not predicate(*args, **kwargs):
+                    continue
+            except Exception as error:  # noqa: BLE001 - Raised from `wait_for()` instead
+                resolved.append((future, error))
+            else:
+                resolved.append((future, None))
+
+            del waiters[future]
+
+        # Settled only once they are gone from the table, as the waits may resume right away in another thread
+        if not waiters:
+            self._waiters.pop(event, None)
+
+        for future, exception in resolved:
+            if future.get_loop() is loop:
+                _settle_waiter(future, args, exception)
+            else:
+                future.get_loop().call_soon_threadsafe(_settle_waiter, future, args, exception)
+
+    def _spawn(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        # Runs listeners called from event loop callbacks, where there is nobody to await them
+        future = asyncio.ensure_future(coroutine)
+        # Keep a reference until done, as the event loop only keeps weak references to tasks
+        self._background.add(future)
+        future.add_done_callback(self._background.discard)
+
 
-            await handler(*args, **kwargs)
+class AsyncIOQueueEventEmitter(AsyncIOEventEmitter):
+    """An `AsyncIOEventEmitter` class that queues emits and runs listeners on long-lived worker tasks.
+
+    This class works like [`AsyncIOEventEmitter`][eventemitter.AsyncIOEventEmitter], except that `emit()` puts the arguments into a bounded [`asyncio.Queue`][asyncio.Queue] and returns, and worker tasks call the listeners.
+    This applies backpressure to producers that emit faster than the listeners can keep up with, instead of piling up concurrent work.
+
+    By default, each event has its own queue, so that the listeners of an event are called with one emit at a time, in the order of the emits.
+    With `per_listener=True`, each listener has its own queue instead, so that a slow listener does not hold back the other listeners of the same event.
+
+    When a queue is full, `emit()` applies the `overflow` policy:
+
+    Policy          | Behavior
+    --------------- | ---------------------------------------------------------------------
+    `"block"`       | Wait until the queue has room
+    `"drop_oldest"` | Drop the oldest emit in the queue to make room
+    `"drop_newest"` | Drop the emit being made
+    `"raise"`       | Raise [`asyncio.QueueFull`][asyncio.QueueFull]
+
+    Notes:
+        - Exceptions raised by listeners are reported to the exception handler of the event loop rather than raised by `emit()`, which has returned by then.
+        - `emit_in_order()` and the `"new_listener"` and `"remove_listener"` events bypass the queues.
+        - Call `join()` to wait for the queued emits to be processed, and `close()` to stop the worker tasks.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+        workers: int = 1,
+        per_listener: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize an instance of `AsyncIOQueueEventEmitter`.
+
+        Args:
+            *args: Arbitrary positional arguments
+            maxsize: The maximum number of emits each queue holds
+            overflow: What `emit()` does when a queue is full: `"block"`, `"drop_oldest"`, `"drop_newest"` or `"raise"`
+            workers: The number of worker tasks that consume each queue. With more than one, emits may be processed out of order.
+            per_listener: Whether each listener has its own queue, rather than each event
+            **kwargs: Arbitrary keyword arguments
+
+        Raises:
+            ValueError: If `maxsize` or `workers` is less than 1, or `overflow` is not a known policy.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Expected maxsize to be at least 1 but got {maxsize}")
+
+        if workers < 1:
+            raise ValueError(f"Expected workers to be at least 1 but got {workers}")
+
+        validate_overflow(overflow)
+
+        super().__init__(*args, **kwargs)
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._num_workers = workers
+        self._per_listener = per_listener
+        # Keyed by the event, or by the handler of the listener if `per_listener` is set
+        self._queues: Dict[Any, asyncio.Queue[Tuple[Tuple[Any, ...], Dict[str, Any]]]] = {}
+        self._workers: Dict[Any, List[asyncio.Future[None]]] = {}
+
+    async def __aenter__(self) -> Self:
+        """Return the emitter itself."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Wait for the queued emits to be processed, and stop the worker tasks."""
+        await self.join()
+        await self.close()
+
+    async def emit(self, event: Hashable, *args: Any, **kwargs: Any) -> bool:
+        """Queue the supplied arguments for the listeners registered for the event named `event`.
+
+        The listeners are called later by the worker tasks. If a queue is full, the `overflow` policy applies.
+
+        Args:
+            event: The name of the event
+            *args: Arbitrary positional arguments
+            **kwargs: Arbitrary keyword arguments
+
+        Returns:
+            (bool): `True` if the `event` had listeners, `False` otherwise.
+
+        Raises:
+            asyncio.QueueFull: If a queue is full and the `overflow` policy is `"raise"`.
+        """
+        handlers = self._events.get(event)
+        if handlers is None:
+            if event in self._waiters:
+                self._resolve_waiters(event, args, kwargs)
+
+            return False
+
+        # The waiters are resolved once the emit has been queued, so not by an emit that is dropped or raises, nor
+        # again when the worker tasks deliver it
+        if not self._per_listener:
+            queue = self._ensure_queue(event, functools.partial(self._deliver_event, event))
+            if await put(queue, (args, kwargs), self._overflow) and event in self._waiters:
+                self._resolve_waiters(event, args, kwargs)
+
+            return True
+
+        queued = False
+        try:
+            for handler in handlers.snapshot:
+                if handler.once:
+                    self._remove_once_handler(event, handler)
+
+                queue = self._ensure_queue(handler, functools.partial(self._deliver_handler, event, handler))
+                queued = await put(queue, (args, kwargs), self._overflow) or queued
+        finally:
+            if queued and event in self._waiters:
+                self._resolve_waiters(event, args, kwargs)
 
         return True
 
+    async def emit_many(self, event: Hashable, iterable_of_args: Iterable[Tuple[Any, ...]], **kwargs: Any) -> bool:
+        """Queue the positional arguments of each payload, along with the supplied keyword arguments, for the listeners registered for the event named `event`.
+
+        Args:
+            event: The name of the event
+            iterable_of_args: The positional arguments of each payload
+            **kwargs: Arbitrary keyword arguments, passed along with every payload
+
+        Returns:
+            (bool): `True` if the `event` had listeners, `False` otherwise.
+        """
+        had_listeners = self._events.get(event) is not None
+        if not had_listeners and event not in self._waiters:
+            return False
+
+        for args in iterable_of_args:
+            await self.emit(event, *args, **kwargs)
+
+        return had_listeners
+
+    async def join(self) -> None:
+        """Wait until every queued emit has been processed."""
+        await asyncio.gather(*(queue.join() for queue in list(self._queues.values())))
+
+    async def close(self) -> None:
+        """Stop the worker tasks. The emits still queued are dropped, and a later emit starts new worker tasks."""
+        workers = [worker for group in self._workers.values() for worker in group]
+        self._queues.clear()
+        self._workers.clear()
+
+        for worker in workers:
+            worker.cancel()
+
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def _ensure_queue(
+        self,
+        key: Any,
+        deliver: Callable[[Tuple[Any, ...], Dict[str, Any]], Coroutine[Any, Any, None]],
+    ) -> asyncio.Queue[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+        queue = self._queues.get(key)
+        if queue is not None:
+            return queue
+
+        if self._per_listener:
+            self._prune_queues()
+
+        queue = self._queues[key] = asyncio.Queue(maxsize=self._maxsize)
+        self._workers[key] = [asyncio.ensure_future(self._work(queue, deliver)) for _ in range(self._num_workers)]
+        return queue
+
+    def _prune_queues(self) -> None:
+        # Listeners removed since are only noticed when a new queue is made, to keep `emit()` cheap
+        registered = {id(handler) for event in self._events for handler in self._events.handlers(event)}
+        for key in [key for key, queue in self._queues.items() if id(key) not in registered and queue.empty()]:
+            del self._queues[key]
+            for worker in self._workers.pop(key):
+                worker.cancel()
+
+    async def _work(
+        self,
+        queue: asyncio.Queue[Tuple[Tuple[Any, ...], Dict[str, Any]]],
+        deliver: Callable[[Tuple[Any, ...], Dict[str, Any]], Coroutine[Any, Any, None]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            args, kwargs = await queue.get()
+            try:
+                await deliver(args, kwargs)
+            except Exception as exception:  # noqa: BLE001 - Reported, so that the worker task keeps going
+                loop.call_exception_handler(
+                    {
+                        "message": "Exception in a listener of AsyncIOQueueEventEmitter",
+                        "exception": exception,
+                    }
+                )
+            finally:
+                queue.task_done()
+
     def _emit_until_complete(self, event: Hashable, *args: Any, **kwargs: Any) -> None:
-        run_coroutine(self.emit, event, *args, **kwargs)
+        # Bypasses the queues, so that the listeners have finished before a listener is added or removed, and no worker
+        # task is started on the helper event loop
+        if self._needs_event_loop(event):
+            if event in self._waiters:
+                self._resolve_waiters(event, args, kwargs)
+
+            run_coroutine(self._deliver_event, event, args, kwargs)
+        else:
+            super()._emit_until_complete(event, *args, **kwargs)
+
+    async def _deliver_event(self, event: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        await self._emit_to_listeners(event, args, kwargs)
+
+    async def _deliver_handler(
+        self,
+        event: Hashable,
+        handler: AsyncHandler,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        if handler not in (self._events.get(event) or ()) and not handler.once:
+            return  # Removed since
+
+        special = handler.batch is not None or handler.coalescer is not None
+        await self._dispatch(event, [handler], False, special, args, kwargs)
+
+
+class _ExecutorEventEmitter(EventEmitter):
+    # Shared by the emitters that run listeners on a `concurrent.futures.Executor`
+
+    def __init__(
+        self,
+        *args: Any,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        wait: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._executor_instance = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers
+        self._wait = wait
+        self._executor_lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        """Return the emitter itself."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Shut down the executor created by the emitter, waiting for the listeners that are still running."""
+        self.shutdown()
+
+    def emit(self, event: Hashable, *args: Any, **kwargs: Any) -> bool:
+        """Submit each of the listeners registered for the event named `event` to the executor, in the order they were registered, passing the supplied arguments to each.
+
+        If the emitter waits for its listeners, `emit()` returns once all of them have completed, and raises the exception of the first listener, in registration order, that failed.
+
+        Args:
+            event: The name of the event
+            *args: Arbitrary positional arguments
+            **kwargs: Arbitrary keyword arguments
+
+        Returns:
+            (bool): `True` if the `event` had listeners, `False` otherwise.
+        """
+        if self._events.get(event) is None:
+            return False
+
+        self._wait_for(self.submit(event, *args, **kwargs))
+        return True
+
+    def emit_many(self, event: Hashable, iterable_of_args: Iterable[Tuple[Any, ...]], **kwargs: Any) -> bool:
+        """Submit each of the listeners registered for the event named `event` to the executor once per payload, passing the positional arguments of the payload and the supplied keyword arguments to each.
+
+        If the emitter waits for its listeners, `emit_many()` returns once all of them have completed, and raises the exception of the first listener, in submission order, that failed.
+
+        Args:
+            event: The name of the event
+            iterable_of_args: The positional arguments of each payload
+            **kwargs: Arbitrary keyword arguments, passed along with every payload
+
+        Returns:
+            (bool): `True` if the `event` had listeners, `False` otherwise.
+        """
+        if self._events.get(event) is None:
+            return False
+
+        self._wait_for(self.submit_many(event, iterable_of_args, **kwargs))
+        return True
+
+    def submit(self, event: Hashable, *args: Any, **kwargs: Any) -> List[Future[Any]]:
+        """Submit each of the listeners registered for the event named `event` to the executor, in the order they were registered, passing the supplied arguments to each, without waiting for them.
+
+        Args:
+            event: The name of the event
+            *args: Arbitrary positional arguments
+            **kwargs: Arbitrary keyword arguments
+
+        Returns:
+            The [`Future`][concurrent.futures.Future]s of the listeners, in the order they were registered.
+        """
+        handlers = self._events.get(event)
+        if handlers is None:
+            return []
+
+        calls = []
+        for handler in handlers.snapshot:
+            if handler.once:
+                self._remove_once_handler(event, handler)
+
+            if handler.batch is None:
+                calls.append((handler.func, args))
+            else:
+                calls.extend((handler.func, (batch,)) for batch in handler.batch.extend([args]))
+
+        return self._submit(self._ensure_executor(), calls, kwargs)
+
+    def submit_many(
+        self, event: Hashable, iterable_of_args: Iterable[Tuple[Any, ...]], **kwargs: Any
+    ) -> List[Future[Any]]:
+        """Submit each of the listeners registered for the event named `event` to the executor once per payload, passing the positional arguments of the payload and the supplied keyword arguments to each, without waiting for them.
+
+        One-time listeners are submitted for the first payload only. Batch listeners, added with `on_batch()`, are submitted once, after all the other listeners, with the list of all the payloads.
+
+        Args:
+            event: The name of the event
+            iterable_of_args: The positional arguments of each payload
+            **kwargs: Arbitrary keyword arguments, passed along with every payload
+
+        Returns:
+            The [`Future`][concurrent.futures.Future]s of the listeners, payload by payload in the order they were registered, followed by those of the batch listeners.
+        """
+        handlers = self._events.get(event)
+        if handlers is None:
+            return []
+
+        per_payload, per_batch = self._partition(handlers.snapshot)
+        once = any(handler.once for handler in per_payload)
+        calls: List[Tuple[Listenable, Tuple[Any, ...]]] = []
+        batch: List[Tuple[Any, ...]] = []
+
+        for args in iterable_of_args:
+            if per_batch:
+                batch.append(args)
+
+            for handler in per_payload:
+                if handler.once:
+                    self._remove_once_handler(event, handler)
+
+                calls.append((handler.func, args))
+
+            if once:
+                per_payload = [handler for handler in per_payload if not handler.once]
+                once = False
+
+        for handler in per_batch:
+            calls.extend((handler.func, (payloads,)) for payloads in cast(BatchBuffer, handler.batch).extend(batch))
+
+        return self._submit(self._ensure_executor(), calls, kwargs)
+
+    def flush(self, event: Optional[Hashable] = None) -> None:
+        """Submit the batch listeners of the event named `event`, or of every event, to the executor with the payloads they have buffered.
+
+        If the emitter waits for its listeners, `flush()` returns once all of them have completed.
+
+        Args:
+            event: The name of the event
+        """
+        calls = [(handler.func, (batch,)) for _, handler, batch in self._take_batches(event)]
+        if calls:
+            self._wait_for(self._submit(self._ensure_executor(), calls, {}))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor created by the emitter. A later emit creates a new one.
+
+        Args:
+            wait: Whether to wait for the listeners that are still running.
+        """
+        with self._executor_lock:
+            if not self._owns_executor or self._executor_instance is None:
+                return
+
+            executor, self._executor_instance = self._executor_instance, None
+
+        executor.shutdown(wait=wait)
+
+    @abstractmethod
+    def _create_executor(self) -> Executor:
+        raise NotImplementedError()
+
+    def _ensure_executor(self) -> Executor:
+        executor = self._executor_instance
+        if executor is not None:
+            return executor
+
+        with self._executor_lock:
+            if self._executor_instance is None:
+                self._executor_instance = self._create_executor()
+
+            return self._executor_instance
+
+    def _submit(
+        self,
+        executor: Executor,
+        calls: List[Tuple[Listenable, Tuple[Any, ...]]],
+        kwargs: Dict[str, Any],
+    ) -> List[Future[Any]]:
+        return [executor.submit(func, *args, **kwargs) for func, args in calls]
+
+    def _wait_for(self, futures: List[Future[Any]]) -> None:
+        if not self._wait or not futures:
+            return
+
+        concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+
+    def _emit_until_complete(self, event: Hashable, *args: Any, **kwargs: Any) -> None:
+        # `"new_listener"` and `"remove_listener"` must complete before the listeners list changes, so run them inline
+        EventEmitter.emit(self, event, *args, **kwargs)
+
+
+class ThreadPoolEventEmitter(_ExecutorEventEmitter):
+    """An `EventEmitter` class that executes listeners on a thread pool.
+
+    This class works like [`EventEmitter`][eventemitter.EventEmitter], except that `emit()` submits each listener to a [`concurrent.futures.Executor`][concurrent.futures.Executor] so that listeners that block on I/O do not serialize the whole emit.
+    By default, the listeners run on a [`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor] owned by the emitter, which is created on the first emit and kept until `shutdown()` is called.
+
+    `emit()` either waits for all the listeners to complete, or returns as soon as they have been submitted ("fire and forget").
+    `submit()` returns the [`Future`][concurrent.futures.Future]s of the listeners, in the order they were registered, so that their results and exceptions can be collected in either mode.
+
+    Notes:
+        - One-time listeners are removed, and `"new_listener"` and `"remove_listener"` listeners are called, in the thread that calls `emit()`.
+        - A listener that emits an event on the same emitter and waits for it can deadlock once all the worker threads are busy.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        wait: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize an instance of `ThreadPoolEventEmitter`.
+
+        Args:
+            *args: Arbitrary positional arguments
+            executor: The executor to run listeners on. If `None`, the emitter creates its own `ThreadPoolExecutor`. An executor passed in is not shut down by `shutdown()`.
+            max_workers: The maximum number of threads of the `ThreadPoolExecutor` created by the emitter. Ignored if `executor` is given.
+            wait: Whether `emit()` waits for all the listeners to complete. If `False`, `emit()` returns as soon as the listeners have been submitted, and their exceptions can only be observed through `submit()`.
+            **kwargs: Arbitrary keyword arguments
+        """
+        super().__init__(*args, executor=executor, max_workers=max_workers, wait=wait, **kwargs)
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="eventemitter")
+
+
+class ProcessPoolEventEmitter(_ExecutorEventEmitter):
+    """An `EventEmitter` class that executes listeners on a process pool.
+
+    This class works like [`ThreadPoolEventEmitter`][eventemitter.ThreadPoolEventEmitter], except that the listeners run in worker processes, so that CPU-bound listeners are not serialized by the GIL.
+    By default, the listeners run on a [`ProcessPoolExecutor`][concurrent.futures.ProcessPoolExecutor] owned by the emitter, which is created on the first emit and whose workers are reused until `shutdown()` is called.
+
+    The listeners and the arguments of `emit()` are sent to the worker processes with [`pickle`][pickle], so the listeners must be functions defined at the top level of a module.
+    Adding a listener that cannot be pickled raises a `ValueError` immediately, rather than failing on the first emit.
+    To reduce the number of round trips, the listeners of an emit can be sent together in chunks of `chunksize`, so that the arguments are pickled once per chunk.
+
+    Notes:
+        - Listeners registered for the `"new_listener"` and `"remove_listener"` events are called in the process that adds or removes listeners, so they do not need to be picklable.
+        - A listener cannot see the state of the process that emits the event. Use the results of the [`Future`][concurrent.futures.Future]s returned by `submit()` to collect what the listeners compute.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        wait: bool = True,
+        chunksize: int = 1,
+        mp_context: Optional[BaseContext] = None,
+        initializer: Optional[Callable[..., Any]] = None,
+        initargs: Tuple[Any, ...] = (),
+        **kwargs: Any,
+    ) -> None:
+        """Initialize an instance of `ProcessPoolEventEmitter`.
+
+        Args:
+            *args: Arbitrary positional arguments
+            executor: The executor to run listeners on. If `None`, the emitter creates its own `ProcessPoolExecutor`. An executor passed in is not shut down by `shutdown()`.
+            max_workers: The maximum number of processes of the `ProcessPoolExecutor` created by the emitter. Ignored if `executor` is given.
+            wait: Whether `emit()` waits for all the listeners to complete. If `False`, `emit()` returns as soon as the listeners have been submitted, and their exceptions can only be observed through `submit()`.
+            chunksize: The maximum number of listeners that are sent to a worker process together.
+            mp_context: The multiprocessing context used to start the worker processes. Ignored if `executor` is given.
+            initializer: A callable run at the start of each worker process, e.g. to load what the listeners need once per worker. Ignored if `executor` is given.
+            initargs: The arguments passed to `initializer`.
+            **kwargs: Arbitrary keyword arguments
+
+        Raises:
+            ValueError: If `chunksize` is less than 1, or if `weak` is enabled.
+        """
+        if chunksize < 1:
+            raise ValueError(f"Expected chunksize to be at least 1 but got {chunksize}")
+
+        if kwargs.get("weak"):
+            # The listeners are defined at the top level of modules, so they would live on anyway
+            raise ValueError("ProcessPoolEventEmitter does not support weak listeners")
+
+        super().__init__(*args, executor=executor, max_workers=max_workers, wait=wait, **kwargs)
+        self._chunksize = chunksize
+        self._mp_context = mp_context
+        self._initializer = initializer
+        self._initargs = initargs
+
+    def _append_handler(self, event: Hashable, handler: Handler) -> Self:
+        self._ensure_picklable(event, handler)
+        return super()._append_handler(event, handler)
+
+    def _prepend_handler(self, event: Hashable, handler: Handler) -> Self:
+        self._ensure_picklable(event, handler)
+        return super()._prepend_handler(event, handler)
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._mp_context,
+            initializer=self._initializer,
+            initargs=self._initargs,
+        )
+
+    def _submit(
+        self,
+        executor: Executor,
+        calls: List[Tuple[Listenable, Tuple[Any, ...]]],
+        kwargs: Dict[str, Any],
+    ) -> List[Future[Any]]:
+        if self._chunksize == 1:
+            return super()._submit(executor, calls, kwargs)
+
+        # Each chunk is a single task, whose outcomes are fanned out to a future per listener
+        futures: List[Future[Any]] = [Future() for _ in calls]
+        for start in range(0, len(calls), self._chunksize):
+            end = start + self._chunksize
+            chunk = executor.submit(call_listeners, calls[start:end], kwargs)
+            chunk.add_done_callback(functools.partial(_resolve_futures, futures[start:end]))
+
+        return futures
+
+    @staticmethod
+    def _ensure_picklable(event: Hashable, handler: Handler) -> None:
+        if event in ("new_listener", "remove_listener"):
+            return
+
+        try:
+            pickle.dumps(handler.func)
+        except Exception as exception:
+            raise ValueError(
+                f"Expected a picklable listener but got {handler.func!r}; "
+                "listeners of a ProcessPoolEventEmitter must be defined at the top level of a module"
+            ) from exception
+
+
+def _resolve_futures(futures: List[Future[Any]], chunk: Future[List[Tuple[Optional[BaseException], Any]]]) -> None:
+    if chunk.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+
+    exception = chunk.exception()
+    # The whole chunk fails if, e.g., the arguments cannot be pickled or a worker process dies
+    outcomes = chunk.result() if exception is None else [(exception, None)] * len(futures)
+
+    for future, (error, result) in zip(futures, outcomes):
+        if not future.set_running_or_notify_cancel():
+            continue  # Cancelled by the caller in the meantime
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+def _settle_waiter(
+    future: asyncio.Future[Tuple[Any, ...]], args: Tuple[Any, ...], exception: Optional[Exception]
+) -> None:
+    if future.done():
+        return  # Timed out or cancelled in the meantime
+
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(args)
+
+
+def _prune_dead(emitter: weakref.ref[AbstractEventEmitter[Any, Any]], event: Hashable) -> None:
+    instance = emitter()
+    if instance is not None:
+        instance._prune(event)
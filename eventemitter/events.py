@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import itertools
+from abc import abstractmethod
 from collections import OrderedDict
-from typing import Generic, Hashable, TypeVar, Union
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Set, TypeVar, Union
 
 from eventemitter.collections import UserDict
 from eventemitter.handlers import AbstractHandler, Handlers
+from eventemitter.patterns import PatternIndex
 from eventemitter.types import AsyncListenable, Listenable
+from eventemitter.weak import unwrap
 
 L = TypeVar("L", bound=Union[Listenable, AsyncListenable])
 H = TypeVar("H", bound=AbstractHandler)
@@ -14,21 +18,168 @@ H = TypeVar("H", bound=AbstractHandler)
 class Events(UserDict[Hashable, Handlers[H]], Generic[L, H]):
     def __init__(self) -> None:
         self.data: OrderedDict[Hashable, Handlers[H]] = OrderedDict()
+        # The number of handlers of all the events, kept up to date by the handlers themselves
+        self.total = 0
 
     def __getitem__(self, event: Hashable) -> Handlers[H]:
         if event not in self.data:
-            self.data[event] = Handlers[H]()
+            self.data[event] = Handlers[H](on_resize=self._resize)
 
         return self.data[event]
 
-    def handlers(self, event: Hashable) -> list[H]:
+    def __delitem__(self, event: Hashable) -> None:
+        self.total -= len(self.data.pop(event))
+
+    def get(self, event: Hashable) -> Optional[Handlers[H]]:  # type: ignore[override]
+        # The handlers to call when `event` is emitted
+        return self.data.get(event)
+
+    def count(self, event: Hashable) -> int:
         if event not in self.data:
-            return []
+            return 0
 
-        return list(self.data[event])
+        return len(self.data[event])
 
-    def listeners(self, event: Hashable) -> list[L]:
+    def handlers(self, event: Hashable) -> tuple[H, ...]:
         if event not in self.data:
-            return []
+            return ()
+
+        return self.data[event].snapshot
+
+    def listeners(self, event: Hashable) -> list[L]:
+        return list(self.iter_listeners(event))
+
+    def iter_listeners(self, event: Hashable) -> Iterator[L]:
+        # Goes over the snapshot taken now, which is only rebuilt after a change and does not change itself
+        listeners = (unwrap(handler.func) for handler in self.handlers(event))
+        return (listener for listener in listeners if listener is not None)
+
+    def source(self, event: Hashable, handler: H) -> Optional[Hashable]:
+        # The event that `handler` has been registered for, if it is still called when `event` is emitted
+        handlers = self.data.get(event)
+        return event if handlers is not None and handler in handlers else None
+
+    def _resize(self, delta: int) -> None:
+        self.total += delta
+
+
+class RoutedEvents(Events[L, H]):
+    # Events whose handlers are also called when other events are emitted. An emitted event resolves to a route, the
+    # handlers of all the events it reaches merged in order, which is cached until the handlers of those events change
+    MAX_ROUTES = 1024
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._routes: Dict[Hashable, Optional[Handlers[H]]] = {}
+
+    def __getitem__(self, event: Hashable) -> Handlers[H]:
+        # Only called to change the handlers of `event`
+        self._invalidate(event)
+        return super().__getitem__(event)
+
+    def __delitem__(self, event: Hashable) -> None:
+        super().__delitem__(event)
+        self._invalidate(event)
+
+    def get(self, event: Hashable) -> Optional[Handlers[H]]:  # type: ignore[override]
+        try:
+            return self._routes[event]
+        except KeyError:
+            pass
+
+        if len(self._routes) >= self.MAX_ROUTES:
+            self._clear_routes()
+
+        route = self._routes[event] = self._route(event)
+        return route
+
+    def source(self, event: Hashable, handler: H) -> Optional[Hashable]:
+        for name in self._reach(event):
+            handlers = self.data.get(name)
+            if handlers is not None and handler in handlers:
+                return name
+
+        return None
+
+    def _route(self, event: Hashable) -> Optional[Handlers[H]]:
+        chain = [self.data[name] for name in self._reach(event) if name in self.data]
+        if len(chain) <= 1:
+            return chain[0] if chain else None
+
+        return Handlers[H](itertools.chain(*chain))
+
+    def _clear_routes(self) -> None:
+        self._routes.clear()
+
+    @abstractmethod
+    def _reach(self, event: Hashable) -> List[Hashable]:
+        # The events whose handlers are called when `event` is emitted, in the order they are called
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _invalidate(self, event: Hashable) -> None:
+        # Drops the routes that reach `event`
+        raise NotImplementedError()
+
+
+class PatternEvents(RoutedEvents[L, H]):
+    # Events whose names contain wildcard segments are patterns, whose handlers are also called for every event whose
+    # name they match, after the handlers of the event itself
+    def __init__(self, delimiter: str = ".") -> None:
+        super().__init__()
+        self._patterns = PatternIndex(delimiter)
+
+    def __getitem__(self, event: Hashable) -> Handlers[H]:
+        if event not in self.data and self._patterns.is_pattern(event):
+            self._patterns.add(event)
+
+        return super().__getitem__(event)
+
+    def __delitem__(self, event: Hashable) -> None:
+        super().__delitem__(event)
+        if self._patterns.is_pattern(event):
+            self._patterns.discard(event)
+
+    def _reach(self, event: Hashable) -> List[Hashable]:
+        if not self._patterns or not isinstance(event, str):
+            return [event]
+
+        # An emitted pattern is just a name, so its own handlers are not matched twice
+        return [event, *(pattern for pattern in self._patterns.match(event) if pattern != event)]
+
+    def _invalidate(self, event: Hashable) -> None:
+        if self._patterns.is_pattern(event):
+            # Any of the events may match the pattern
+            self._clear_routes()
+        else:
+            self._routes.pop(event, None)
+
+
+class HierarchicalEvents(RoutedEvents[L, H]):
+    # Events named by tuples form a tree, in which the handlers of an event are also called for all of its descendants,
+    # after theirs, so that an event bubbles up from its own handlers to those of its root
+    def __init__(self) -> None:
+        super().__init__()
+        # The events with a cached route through each event, so that a change only drops the routes of its subtree
+        self._subtrees: Dict[Hashable, Set[Hashable]] = {}
+
+    def _route(self, event: Hashable) -> Optional[Handlers[H]]:
+        for ancestor in self._reach(event):
+            self._subtrees.setdefault(ancestor, set()).add(event)
+
+        return super()._route(event)
+
+    def _clear_routes(self) -> None:
+        super()._clear_routes()
+        self._subtrees.clear()
+
+    def _reach(self, event: Hashable) -> List[Hashable]:
+        if not isinstance(event, tuple) or not event:
+            # The empty tuple has no ancestors, and is not one of any other event either
+            return [event]
+
+        return [event[:end] for end in range(len(event), 0, -1)]
 
-        return [handler.func for handler in self.data[event]]
+    def _invalidate(self, event: Hashable) -> None:
+        for descendant in self._subtrees.pop(event, ()):
+            self._routes.pop(descendant, None)
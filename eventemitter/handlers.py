@@ -1,109 +1,249 @@
-import sys
+import inspect
 from abc import ABC
-from dataclasses import dataclass
-from typing import Any, Callable, Generic, Optional, Type, TypeVar, Union
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Self, assert_never
 
-from eventemitter.collections import UserList
+from eventemitter.batching import BatchBuffer
+from eventemitter.coalescing import Coalescer
 from eventemitter.types import AsyncListenable, Listenable
-from eventemitter.utils import ensure_coroutine, name_from_callable
+from eventemitter.utils import is_coroutine_function, name_from_callable
+from eventemitter.weak import refers_to
 
 L = TypeVar("L", bound=Union[Listenable, AsyncListenable])
 H = TypeVar("H", bound="AbstractHandler")
 
-_dataclass_options = {}
-if sys.version_info >= (3, 10):
-    _dataclass_options["slots"] = True
+
+def key_of(func: Any) -> Hashable:
+    # What the handlers of `func` are looked up by. A bound method is made anew on every attribute access, and the one
+    # passed in is usually gone right after, so it is keyed by what it binds instead
+    if inspect.ismethod(func):
+        return (id(func.__self__), id(func.__func__))
+
+    return id(func)
 
 
-@dataclass(frozen=True, **_dataclass_options)
 class AbstractHandler(ABC, Generic[L]):
-    id: int
-    func: L
-    once: bool
+    __slots__ = ("batch", "coalescer", "func", "id", "once")
+
+    def __init__(
+        self,
+        func: L,
+        once: bool = False,
+        batch: Optional[BatchBuffer] = None,
+        coalescer: Optional[Coalescer] = None,
+    ) -> None:
+        self.id = key_of(func)
+        self.func = func
+        self.once = once
+        self.batch = batch
+        self.coalescer = coalescer
 
     @classmethod
-    def from_func(cls: Type[Self], func: L, once: bool = False) -> Self:
-        return cls(id=id(func), func=func, once=once)
+    def from_func(
+        cls: Type[Self],
+        func: L,
+        once: bool = False,
+        batch: Optional[BatchBuffer] = None,
+        coalescer: Optional[Coalescer] = None,
+    ) -> Self:
+        return cls(func, once, batch, coalescer)
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}(func={name_from_callable(self.func)}@0x{self.id:x}, once={self.once!r})"
+        return (
+            f"{type(self).__name__}(func={name_from_callable(self.func)}@0x{id(self.func):x}, "
+            f"once={self.once!r}, batch={self.batch is not None!r})"
+        )
 
 
-@dataclass(frozen=True, **_dataclass_options)
 class Handler(AbstractHandler[Listenable]):
+    __slots__ = ()
+
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         self.func(*args, **kwargs)
 
 
-@dataclass(frozen=True, **_dataclass_options)
 class AsyncHandler(AbstractHandler[Union[Listenable, AsyncListenable]]):
-    coroutine: AsyncListenable
+    __slots__ = ("is_coroutine",)
 
-    @classmethod
-    def from_func(cls: Type[Self], func: Union[Listenable, AsyncListenable], once: bool = False) -> Self:
-        return cls(id=id(func), func=func, once=once, coroutine=ensure_coroutine(func))
+    def __init__(
+        self,
+        func: Union[Listenable, AsyncListenable],
+        once: bool = False,
+        batch: Optional[BatchBuffer] = None,
+        coalescer: Optional[Coalescer] = None,
+    ) -> None:
+        if not callable(func):
+            raise ValueError(f"Expected a callable but got {type(func)}")
+
+        super().__init__(func, once, batch, coalescer)
+        self.is_coroutine = is_coroutine_function(func)
 
     async def __call__(self, *args: Any, **kwargs: Any) -> None:
-        await self.coroutine(*args, **kwargs)
+        if self.is_coroutine:
+            await cast(AsyncListenable, self.func)(*args, **kwargs)
+        else:
+            self.func(*args, **kwargs)
+
+
+class Handlers(Generic[H]):
+    __slots__ = (
+        "_head",
+        "_index",
+        "_num_batch",
+        "_num_coalesced",
+        "_num_once",
+        "_on_resize",
+        "_snapshot",
+        "_tail",
+        "data",
+    )
+
+    def __init__(
+        self,
+        handlers: Optional[Iterable[H]] = None,
+        on_resize: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        # Handlers are keyed by their position, which only grows on `append()` and only shrinks on `prepend()`,
+        # so the order of the keys is the order of the handlers
+        self.data: OrderedDict[int, H] = OrderedDict()
+        # Positions of the handlers of each function, in ascending order, keyed by the key of the function
+        self._index: Dict[Hashable, List[int]] = {}
+        self._head = 0
+        self._tail = 0
+        self._num_once = 0
+        self._num_batch = 0
+        self._num_coalesced = 0
+        self._snapshot: Optional[Tuple[H, ...]] = None
+        # Told how many handlers have been added, or removed if negative, to keep count across many `Handlers`
+        self._on_resize = on_resize
+
+        if handlers is not None:
+            for handler in handlers:
+                self.append(handler)
+
+    def __contains__(self, handler: object) -> bool:
+        if not isinstance(handler, AbstractHandler):
+            return False
+
+        return any(self.data[position] is handler for position in self._index.get(handler.id, ()))
+
+    def __iter__(self) -> Iterator[H]:
+        return iter(self.data.values())
+
+    def __len__(self) -> int:
+        return len(self.data)
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.data.values())!r})"
 
-class Handlers(UserList[H], Generic[H]):
-    def prepend(self, handler: H) -> None:
-        self.data.insert(0, handler)
+    @property
+    def has_once(self) -> bool:
+        return self._num_once > 0
 
-    def find(self, target: H) -> Optional[int]:
-        return self._find(lambda handler: handler is target)
+    @property
+    def has_batch(self) -> bool:
+        return self._num_batch > 0
 
-    def find_by_id(self, target: Union[H, Listenable, AsyncListenable]) -> Optional[int]:
-        target_id = self._id_of(target)
-        return self._find(lambda handler: handler.id == target_id)
+    @property
+    def has_coalesced(self) -> bool:
+        return self._num_coalesced > 0
 
-    def rfind(self, target: H) -> Optional[int]:
-        return self._rfind(lambda handler: handler is target)
+    @property
+    def snapshot(self) -> Tuple[H, ...]:
+        # Rebuilt only after a mutation, so that emitting does not copy the handlers every time
+        if self._snapshot is None:
+            self._snapshot = tuple(self.data.values())
 
-    def rfind_by_id(self, target: Union[H, Listenable, AsyncListenable]) -> Optional[int]:
-        target_id = self._id_of(target)
-        return self._rfind(lambda handler: handler.id == target_id)
+        return self._snapshot
 
-    def remove(self, target: H, last: bool = False) -> H:  # type: ignore[override]
-        finder = self.find if not last else self.rfind
-        index = finder(target)
+    def append(self, handler: H) -> None:
+        position = self._tail
+        self._tail += 1
 
-        if index is None:
-            raise ValueError(f"{target!r} not in list")
+        self.data[position] = handler
+        self._index.setdefault(handler.id, []).append(position)
+        self._num_once += handler.once
+        self._num_batch += handler.batch is not None
+        self._num_coalesced += handler.coalescer is not None
+        self._snapshot = None
 
-        return self.data.pop(index)
+        if self._on_resize is not None:
+            self._on_resize(1)
+
+    def prepend(self, handler: H) -> None:
+        self._head -= 1
+        position = self._head
+
+        self.data[position] = handler
+        self.data.move_to_end(position, last=False)
+        self._index.setdefault(handler.id, []).insert(0, position)
+        self._num_once += handler.once
+        self._num_batch += handler.batch is not None
+        self._num_coalesced += handler.coalescer is not None
+        self._snapshot = None
+
+        if self._on_resize is not None:
+            self._on_resize(1)
+
+    def remove(self, target: H, last: bool = False) -> H:
+        positions = self._index.get(target.id, [])
+        for index in reversed(range(len(positions))) if last else range(len(positions)):
+            if self.data[positions[index]] is target:
+                return self._pop(target.id, index)
+
+        raise ValueError(f"{target!r} not in handlers")
 
     def remove_by_id(self, target: Union[H, Listenable, AsyncListenable], last: bool = False) -> H:
-        finder = self.find_by_id if not last else self.rfind_by_id
-        index = finder(target)
+        # The positions are looked up by key, but a listener held by a weak reference may be gone and have left its id
+        # to another function, so the handlers found are also checked to be for `target` itself
+        target_id = self._id_of(target)
+        positions = self._index.get(target_id, [])
+        for index in reversed(range(len(positions))) if last else range(len(positions)):
+            handler = self.data[positions[index]]
+            if handler is target or refers_to(handler.func, target):
+                return self._pop(target_id, index)
 
-        if index is None:
-            raise ValueError(f"{target!r} not in list")
+        raise ValueError(f"{target!r} not in handlers")
 
-        return self.data.pop(index)
+    def _pop(self, target_id: Hashable, index: int) -> H:
+        positions = self._index[target_id]
+        handler = self.data.pop(positions.pop(index))
 
-    def _find(self, condition: Callable[[H], bool]) -> Optional[int]:
-        for index, handler in enumerate(self.data):
-            if condition(handler):
-                return index
-        else:
-            return None
+        if not positions:
+            del self._index[target_id]
 
-    def _rfind(self, condition: Callable[[H], bool]) -> Optional[int]:
-        for index, handler in enumerate(reversed(self.data)):
-            if condition(handler):
-                return len(self.data) - index - 1
-        else:
-            return None
+        self._num_once -= handler.once
+        self._num_batch -= handler.batch is not None
+        self._num_coalesced -= handler.coalescer is not None
+        self._snapshot = None
+
+        if self._on_resize is not None:
+            self._on_resize(-1)
+
+        return handler
 
     @staticmethod
-    def _id_of(instance: Union[H, Listenable, AsyncListenable]) -> int:
+    def _id_of(instance: Union[H, Listenable, AsyncListenable]) -> Hashable:
         if isinstance(instance, AbstractHandler):
             return instance.id
         elif callable(instance):
-            return id(instance)
+            return key_of(instance)
         else:
             assert_never(instance)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional
+
+from typing_extensions import TypeGuard
+
+# A wildcard segment matches exactly one segment, and a globstar segment matches any number of them, including none
+WILDCARD = "*"
+GLOBSTAR = "**"
+
+
+class _Node:
+    __slots__ = ("children", "pattern", "sequence")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _Node] = {}
+        # Set on the node that a pattern ends at
+        self.pattern: Optional[str] = None
+        self.sequence = 0
+
+
+class PatternIndex:
+    # A trie of patterns keyed by their segments, so that matching an event walks the segments of its name once,
+    # branching only at wildcards, instead of testing every pattern
+    __slots__ = ("_root", "_sequence", "delimiter")
+
+    def __init__(self, delimiter: str = ".") -> None:
+        if not delimiter:
+            raise ValueError("Expected a non-empty delimiter")
+
+        self.delimiter = delimiter
+        self._root = _Node()
+        self._sequence = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._root.children)
+
+    def is_pattern(self, event: Hashable) -> TypeGuard[str]:
+        return isinstance(event, str) and any(
+            segment in (WILDCARD, GLOBSTAR) for segment in event.split(self.delimiter)
+        )
+
+    def add(self, pattern: str) -> None:
+        node = self._root
+        for segment in pattern.split(self.delimiter):
+            node = node.children.setdefault(segment, _Node())
+
+        if node.pattern is None:
+            node.pattern = pattern
+            node.sequence = self._sequence
+            self._sequence += 1
+
+    def discard(self, pattern: str) -> None:
+        path = [self._root]
+        segments = pattern.split(self.delimiter)
+        for segment in segments:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+
+            path.append(node)
+
+        path[-1].pattern = None
+
+        # Prune the branch up to the last node still in use
+        for depth in reversed(range(len(segments))):
+            node = path[depth + 1]
+            if node.pattern is not None or node.children:
+                break
+
+            del path[depth].children[segments[depth]]
+
+    def match(self, event: str) -> List[str]:
+        # The patterns matching `event`, in the order they were added
+        found: Dict[str, int] = {}
+        self._match(self._root, event.split(self.delimiter), 0, found)
+        return sorted(found, key=found.__getitem__)
+
+    def _match(self, node: _Node, segments: List[str], index: int, found: Dict[str, int]) -> None:
+        children = node.children
+
+        if index == len(segments):
+            if node.pattern is not None:
+                found[node.pattern] = node.sequence
+
+            globstar = children.get(GLOBSTAR)
+            if globstar is not None:
+                self._match(globstar, segments, index, found)
+
+            return
+
+        child = children.get(segments[index])
+        if child is not None:
+            self._match(child, segments, index + 1, found)
+
+        child = children.get(WILDCARD)
+        if child is not None:
+            self._match(child, segments, index + 1, found)
+
+        child = children.get(GLOBSTAR)
+        if child is not None:
+            for end in range(index, len(segments) + 1):
+                self._match(child, segments, end, found)
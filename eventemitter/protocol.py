@@ -71,6 +71,28 @@ class EventEmitterProtocol(Protocol[L]):
         """
         ...
 
+    def has_listeners(self, event: Optional[Hashable] = None) -> bool:
+        """Return whether the emitter has listeners for the event named `event`, or for any event if `event` is `None`.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            `True` if there are listeners, `False` otherwise.
+        """
+        ...
+
+    def listener_count(self, event: Optional[Hashable] = None) -> int:
+        """Return the number of listeners for the event named `event`, or for all events if `event` is `None`, without copying them.
+
+        Args:
+            event: The name of the event
+
+        Returns:
+            The number of listeners.
+        """
+        ...
+
     def listeners(self, event: Hashable) -> List[L]:
         """Return a copy of the list of listeners for the event named `event`.
 
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from typing_extensions import Literal, get_args
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "raise"]
+
+
+def validate_overflow(overflow: str) -> None:
+    if overflow not in get_args(OverflowPolicy):
+        raise ValueError(f"Expected one of {get_args(OverflowPolicy)} for overflow but got {overflow!r}")
+
+
+async def put(queue: asyncio.Queue[Any], item: Any, overflow: OverflowPolicy) -> bool:
+    # Returns whether `item` has been enqueued
+    if overflow == "block":
+        await queue.put(item)
+        return True
+
+    return put_nowait(queue, item, overflow)
+
+
+def put_nowait(queue: asyncio.Queue[Any], item: Any, overflow: OverflowPolicy) -> bool:
+    # `"block"` cannot wait here, so it is left to the caller
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        if overflow == "drop_newest":
+            return False
+        elif overflow == "drop_oldest":
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(item)
+        else:
+            raise
+
+    return True
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Hashable, List, Optional, Tuple, Union
+
+from typing_extensions import Self
+
+from eventemitter.queues import OverflowPolicy, put, put_nowait, validate_overflow
+from eventemitter.types import AsyncListenable, Listenable
+
+if TYPE_CHECKING:
+    from eventemitter.eventemitter import AsyncIOEventEmitter
+
+# Wakes up a consumer waiting on a closed stream
+_CLOSED = object()
+
+
+class EventStream:
+    """An asynchronous iterator over the emits of an event, returned by [`AsyncIOEventEmitter.stream()`][eventemitter.AsyncIOEventEmitter.stream].
+
+    Each item is the tuple of the positional arguments of an emit. Closing the stream removes its listener from the emitter.
+    """
+
+    def __init__(
+        self,
+        emitter: AsyncIOEventEmitter,
+        event: Hashable,
+        maxsize: int = 1000,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        """Initialize an instance of `EventStream` and add its listener to `emitter`.
+
+        Args:
+            emitter: The emitter to listen to
+            event: The name of the event
+            maxsize: The maximum number of emits buffered until they are consumed
+            overflow: What the listener does when the buffer is full: `"block"`, `"drop_oldest"`, `"drop_newest"` or `"raise"`
+
+        Raises:
+            ValueError: If `maxsize` is less than 1 or `overflow` is not a known policy.
+        """
+        if maxsize < 1:
+            raise ValueError(f"Expected maxsize to be at least 1 but got {maxsize}")
+
+        validate_overflow(overflow)
+
+        self._emitter = emitter
+        self._event = event
+        self._overflow = overflow
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+        self._closed = False
+
+        # Only blocking needs to await, so the other policies get a plain function that is called inline
+        self._listener: Union[Listenable, AsyncListenable] = self._put if overflow == "block" else self._put_nowait
+        emitter.on(event, self._listener)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream has been closed."""
+        return self._closed
+
+    def __aiter__(self) -> Self:
+        """Return the stream itself."""
+        return self
+
+    async def __anext__(self) -> Tuple[Any, ...]:
+        """Wait for the next emit and return its positional arguments.
+
+        Raises:
+            StopAsyncIteration: If the stream has been closed.
+        """
+        if self._closed:
+            raise StopAsyncIteration
+
+        item = await self._queue.get()
+        if self._closed or item is _CLOSED:
+            raise StopAsyncIteration
+
+        return item
+
+    async def __aenter__(self) -> Self:
+        """Return the stream itself."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close the stream."""
+        await self.aclose()
+
+    async def next_batch(self, max_items: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        """Wait for at least one emit, and return the positional arguments of all the buffered emits, up to `max_items`.
+
+        Args:
+            max_items: The maximum number of emits to return, or `None` for no limit
+
+        Returns:
+            The positional arguments of the emits, oldest first. Empty if the stream has been closed.
+        """
+        try:
+            batch = [await self.__anext__()]
+        except StopAsyncIteration:
+            return []
+
+        while not self._queue.empty() and (max_items is None or len(batch) < max_items):
+            item = self._queue.get_nowait()
+            if item is _CLOSED:
+                break
+
+            batch.append(item)
+
+        return batch
+
+    async def aclose(self) -> None:
+        """Remove the listener of the stream from the emitter, and drop the emits that have not been consumed."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._emitter.remove_listener(self._event, self._listener)
+
+        # Draining the buffer wakes up listeners blocked on it, which may fill it again before they return
+        while not self._queue.empty():
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+            await asyncio.sleep(0)
+
+        self._queue.put_nowait(_CLOSED)
+
+    async def _put(self, *args: Any, **kwargs: Any) -> None:
+        if not self._closed:
+            await put(self._queue, args, "block")
+
+    def _put_nowait(self, *args: Any, **kwargs: Any) -> None:
+        if not self._closed:
+            put_nowait(self._queue, args, self._overflow)
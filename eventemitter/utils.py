@@ -1,8 +1,11 @@
 import asyncio
+import atexit
 import functools
 import inspect
+import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 from typing_extensions import ParamSpec, TypeGuard, overload
 
@@ -28,28 +31,73 @@ def is_coroutine_function(func: Any) -> Any:
     return inspect.iscoroutinefunction(func) or (callable(func) and inspect.iscoroutinefunction(func.__call__))
 
 
-@overload
-def ensure_coroutine(func: Callable[P, R]) -> AsyncCallable[P, R]: ...
-@overload
-def ensure_coroutine(func: AsyncCallable[P, R]) -> AsyncCallable[P, R]: ...
+class EventLoopThread:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
 
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
 
-def ensure_coroutine(func: Any) -> Any:
-    if not callable(func):
-        raise ValueError(f"Expected a callable but got {type(func)}")
+    def run(self, coroutine: AsyncCallable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        if getattr(_thread_state, "nested", False):
+            # The helper loop may be blocked waiting for this very thread, so nested calls get a loop of their own
+            return _run_in_new_thread(coroutine, *args, **kwargs)
+
+        loop = self._ensure_running()
+        return asyncio.run_coroutine_threadsafe(coroutine(*args, **kwargs), loop).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if loop is None or thread is None:
+            return
+
+        if thread.is_alive():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+        loop.close()
 
-    if is_coroutine_function(func):
-        return func
+    def _ensure_running(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A thread does not survive `fork()`, so the loop is rebuilt whenever its thread is gone
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=_run_forever,
+                    args=(self._loop,),
+                    name="eventemitter-loop",
+                    daemon=True,
+                )
+                self._thread.start()
 
-    @functools.wraps(func)
-    async def coroutine(*args: Any, **kwargs: Any) -> None:
-        func(*args, **kwargs)
+            return self._loop
 
-    return coroutine
+
+_thread_state = threading.local()
+
+_event_loop_thread = EventLoopThread()
+atexit.register(_event_loop_thread.shutdown)
 
 
 def run_coroutine(coroutine: AsyncCallable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    return _event_loop_thread.run(coroutine, *args, **kwargs)
+
+
+def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+    _thread_state.nested = True
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def _run_in_new_thread(coroutine: AsyncCallable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
     def event_loop() -> R:
+        _thread_state.nested = True
         loop = asyncio.new_event_loop()
 
         try:
@@ -58,9 +106,78 @@ def run_coroutine(coroutine: AsyncCallable[P, R], *args: P.args, **kwargs: P.kwa
         finally:
             loop.close()
 
-    executor = ThreadPoolExecutor(max_workers=1)
-    future = executor.submit(event_loop)
-    return future.result()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(event_loop).result()
+
+
+async def gather_eagerly(*coroutines: Coroutine[Any, Any, T]) -> List[T]:
+    if sys.version_info < (3, 12):
+        return await asyncio.gather(*coroutines)
+
+    # Each coroutine runs until its first suspension before the task is scheduled
+    loop = asyncio.get_running_loop()
+    tasks = [asyncio.Task(coroutine, loop=loop, eager_start=True) for coroutine in coroutines]
+
+    if all(task.done() for task in tasks):
+        # Nothing suspended, so skip the round trips through the event loop that `asyncio.gather()` would take
+        for task in tasks:
+            if not task.cancelled():
+                task.exception()  # Mark every exception as retrieved, not only the first one raised below
+
+        return [task.result() for task in tasks]
+
+    return await asyncio.gather(*tasks)
+
+
+async def gather_bounded(coroutines: Sequence[Coroutine[Any, Any, Any]], limit: int, eager: bool = False) -> None:
+    # A fixed set of workers takes the coroutines one by one, so that at most `limit` of them run at the same time
+    iterator = iter(coroutines)
+    errors: List[Exception] = []
+
+    async def worker() -> None:
+        for coroutine in iterator:
+            try:
+                await coroutine
+            except Exception as exception:  # noqa: BLE001 - Raised once every coroutine has run
+                errors.append(exception)
+
+    try:
+        workers = [worker() for _ in range(min(limit, len(coroutines)))]
+        if eager:
+            await gather_eagerly(*workers)
+        else:
+            await asyncio.gather(*workers)
+    finally:
+        # Only left over when the workers have been cancelled
+        for coroutine in iterator:
+            coroutine.close()
+
+    if errors:
+        raise errors[0]
+
+
+def call_listeners(
+    calls: Sequence[Tuple[Callable[..., Any], Tuple[Any, ...]]],
+    kwargs: Dict[str, Any],
+) -> List[Tuple[Optional[BaseException], Any]]:
+    # Runs in a worker process, so one failing listener must not keep the rest of its chunk from running
+    outcomes: List[Tuple[Optional[BaseException], Any]] = []
+    for func, args in calls:
+        try:
+            outcomes.append((None, func(*args, **kwargs)))
+        except Exception as exception:  # noqa: BLE001 - Set on the future of the listener instead
+            outcomes.append((exception, None))
+
+    return outcomes
+
+
+def caller_site() -> Tuple[str, int, str]:
+    # The file, line and module of the innermost caller outside of this package, e.g. of where a listener is added
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_globals.get("__name__", "").partition(".")[0] == "eventemitter":
+        frame = frame.f_back
+
+    return frame.f_code.co_filename, frame.f_lineno, frame.f_globals.get("__name__", "")
 
 
 def name_from_callable(func: Any) -> str:
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import inspect
+import weakref
+from typing import Any, Callable, Optional, Union
+
+from eventemitter.types import AsyncListenable, Listenable
+from eventemitter.utils import is_coroutine_function
+
+
+class AbstractWeakListener:
+    # Refers to a listener weakly, so that registering it keeps neither the listener nor, for a bound method, its
+    # instance alive. Once the listener is gone, calling this does nothing but report it to `on_dead`
+    __slots__ = ("_on_dead", "ref")
+
+    def __init__(self, func: Callable[..., Any], on_dead: Callable[[], None]) -> None:
+        if inspect.isbuiltin(func) and func.__self__ is not None and not inspect.ismodule(func.__self__):
+            # Unlike a bound method, it cannot be made again from a reference to its instance
+            raise ValueError(f"Expected a listener that can be weakly referenced but got {func!r}")
+
+        try:
+            # A bound method is made anew on every attribute access, so it is its instance that is referenced
+            self.ref: weakref.ref[Callable[..., Any]] = (
+                weakref.WeakMethod(func) if inspect.ismethod(func) else weakref.ref(func)
+            )
+        except TypeError as exception:
+            raise ValueError(f"Expected a listener that can be weakly referenced but got {func!r}") from exception
+
+        self._on_dead = on_dead
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.ref()!r})"
+
+
+class WeakListener(AbstractWeakListener):
+    __slots__ = ()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> None:
+        func = self.ref()
+        if func is None:
+            self._on_dead()
+            return
+
+        func(*args, **kwargs)
+
+
+class AsyncWeakListener(AbstractWeakListener):
+    __slots__ = ()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        func = self.ref()
+        if func is None:
+            self._on_dead()
+            return
+
+        await func(*args, **kwargs)
+
+
+def weaken(func: Union[Listenable, AsyncListenable], on_dead: Callable[[], None]) -> AbstractWeakListener:
+    if is_coroutine_function(func):
+        return AsyncWeakListener(func, on_dead)
+    else:
+        return WeakListener(func, on_dead)
+
+
+def unwrap(func: Any) -> Optional[Any]:
+    # The listener that `func` stands for, or `None` if it was referenced weakly and is gone
+    if isinstance(func, AbstractWeakListener):
+        return func.ref()
+
+    return func
+
+
+def refers_to(func: Any, target: Any) -> bool:
+    # Whether `func` is `target`, or holds it by a weak reference
+    if func is target:
+        return True
+
+    listener = unwrap(func)
+    if inspect.ismethod(listener) and inspect.ismethod(target):
+        # A bound method is made anew on every attribute access, so only what it binds can be compared
+        return listener.__self__ is target.__self__ and listener.__func__ is target.__func__
+
+    return listener is target
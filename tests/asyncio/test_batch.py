@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from utils import make_async_listener, trackable
+
+from eventemitter import AsyncIOEventEmitter
+
+
+@pytest.mark.asyncio
+async def test_max_size(aee: AsyncIOEventEmitter) -> None:
+    batches = []
+    listener = trackable(make_async_listener())
+
+    async def batch_listener(batch: list[tuple[Any, ...]]) -> None:
+        batches.append(batch)
+
+    aee.on_batch("foo", batch_listener, max_size=3)
+    aee.on("foo", listener)
+
+    for value in range(7):
+        await aee.emit("foo", value)
+
+    assert listener.hits == 7
+    assert batches == [[(0,), (1,), (2,)], [(3,), (4,), (5,)]]
+
+    await aee.flush()
+    assert batches[-1] == [(6,)]
+
+
+@pytest.mark.asyncio
+async def test_max_size_emit_many(aee: AsyncIOEventEmitter) -> None:
+    batches = []
+
+    aee.on_batch("foo", batches.append, max_size=2)
+
+    await aee.emit_many("foo", [(value,) for value in range(5)])
+    assert batches == [[(0,), (1,)], [(2,), (3,)]]
+
+    await aee.emit_in_order("foo", 5)
+    assert batches[-1] == [(4,), (5,)]
+
+
+@pytest.mark.asyncio
+async def test_max_delay(aee: AsyncIOEventEmitter) -> None:
+    batches = []
+
+    async def batch_listener(batch: list[tuple[Any, ...]]) -> None:
+        batches.append(batch)
+
+    aee.on_batch("foo", batch_listener, max_delay=0.05)
+
+    await aee.emit("foo", 1)
+    await aee.emit("foo", 2)
+    assert batches == []
+
+    # The delivery is scheduled on the running event loop
+    await asyncio.sleep(0.1)
+    assert batches == [[(1,), (2,)]]
+
+    await aee.emit("foo", 3)
+    await asyncio.sleep(0.1)
+    assert batches == [[(1,), (2,)], [(3,)]]
+
+
+@pytest.mark.asyncio
+async def test_max_delay_after_max_size(aee: AsyncIOEventEmitter) -> None:
+    batches = []
+
+    aee.on_batch("foo", batches.append, max_size=2, max_delay=0.05)
+
+    await aee.emit("foo", 1)
+    await aee.emit("foo", 2)
+    await aee.emit("foo", 3)
+    assert batches == [[(1,), (2,)]]
+
+    await asyncio.sleep(0.1)
+    assert batches == [[(1,), (2,)], [(3,)]]
+
+
+@pytest.mark.asyncio
+async def test_max_delay_removed(aee: AsyncIOEventEmitter) -> None:
+    batches = []
+    listener = batches.append
+
+    aee.on_batch("foo", listener, max_delay=0.05)
+
+    await aee.emit("foo", 1)
+    aee.remove_listener("foo", listener)
+
+    await asyncio.sleep(0.1)
+    assert batches == []
+
+
+@pytest.mark.asyncio
+async def test_columnar(aee: AsyncIOEventEmitter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("eventemitter.batching.numpy", None)
+
+    batches = []
+
+    aee.on_batch("foo", batches.append, columnar=True)
+
+    await aee.emit_many("foo", [(1, "a"), (2, "b")])
+    assert batches == [[[1, 2], ["a", "b"]]]
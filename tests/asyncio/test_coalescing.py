@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from utils import make_async_listener, make_listener, trackable
+
+from eventemitter import AsyncIOEventEmitter
+
+WAIT = 0.05
+
+
+def values(listener: Any) -> list[Any]:
+    return [context.args[0] for context in listener.contexts]
+
+
+@pytest.mark.asyncio
+async def test_debounce_trailing(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+    other = trackable(make_listener())
+
+    aee.on_debounced("foo", listener, wait=WAIT)
+    aee.on("foo", other)
+
+    for value in range(5):
+        await aee.emit("foo", value)
+
+    assert listener.hits == 0
+    # Other listeners of the same event are not affected
+    assert other.hits == 5
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [4]
+
+
+@pytest.mark.asyncio
+async def test_debounce_leading(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    aee.on_debounced("foo", listener, wait=WAIT, leading=True)
+
+    for value in range(5):
+        await aee.emit("foo", value)
+
+    assert values(listener) == [0]
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [0, 4]
+
+    # A single emit in a burst is not delivered twice
+    await aee.emit("foo", 5)
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [0, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_debounce_leading_only(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on_debounced("foo", listener, wait=WAIT, leading=True, trailing=False)
+
+    for value in range(5):
+        await aee.emit("foo", value)
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [0]
+
+
+@pytest.mark.asyncio
+async def test_throttle(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on_throttled("foo", listener, interval=WAIT)
+
+    for value in range(5):
+        await aee.emit("foo", value)
+
+    assert values(listener) == [0]
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [0, 4]
+
+
+@pytest.mark.asyncio
+async def test_throttle_rate(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on_throttled("foo", listener, interval=WAIT * 2)
+
+    loop = asyncio.get_running_loop()
+    end = loop.time() + WAIT * 5
+    value = 0
+    while loop.time() < end:
+        await aee.emit("foo", value)
+        value += 1
+        await asyncio.sleep(WAIT / 10)
+
+    await asyncio.sleep(WAIT * 3)
+    # At most one call every interval, plus the leading one
+    assert 2 <= listener.hits <= 4
+    assert values(listener)[-1] == value - 1
+
+
+@pytest.mark.asyncio
+async def test_throttle_trailing_only(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on_throttled("foo", listener, interval=WAIT, leading=False)
+
+    await aee.emit("foo", 0)
+    await aee.emit("foo", 1)
+    assert listener.hits == 0
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [1]
+
+
+@pytest.mark.asyncio
+async def test_decorator(aee: AsyncIOEventEmitter) -> None:
+    calls = []
+
+    @aee.on_throttled("foo", interval=WAIT)
+    async def listener(value: int) -> None:
+        calls.append(value)
+
+    await aee.emit("foo", 1)
+    assert calls == [1]
+    assert aee.listeners("foo") == [listener]
+
+
+@pytest.mark.asyncio
+async def test_remove_listener(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on_debounced("foo", listener, wait=WAIT)
+
+    await aee.emit("foo", 1)
+    aee.remove_listener("foo", listener)
+
+    await asyncio.sleep(WAIT * 2)
+    assert listener.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_set_debounce(aee: AsyncIOEventEmitter) -> None:
+    listener1 = trackable(make_async_listener())
+    listener2 = trackable(make_listener())
+
+    aee.on("foo", listener1)
+    aee.on("foo", listener2)
+    aee.set_debounce("foo", WAIT)
+
+    for value in range(5):
+        assert await aee.emit("foo", value)
+
+    assert listener1.hits == 0
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener1) == [4]
+    assert values(listener2) == [4]
+
+    # Events without listeners are not held back
+    aee.set_debounce("bar", WAIT)
+    assert not await aee.emit("bar")
+
+
+@pytest.mark.asyncio
+async def test_set_throttle(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on("foo", listener)
+    aee.set_throttle("foo", WAIT)
+
+    await aee.emit_many("foo", [(value,) for value in range(5)])
+    assert values(listener) == [0]
+
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [0, 4]
+
+
+@pytest.mark.asyncio
+async def test_clear_coalescing(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    aee.on("foo", listener)
+    aee.set_debounce("foo", WAIT)
+
+    await aee.emit("foo", 1)
+    aee.clear_coalescing("foo")
+
+    await aee.emit("foo", 2)
+    await asyncio.sleep(WAIT * 2)
+    assert values(listener) == [2]
+
+
+def test_invalid_arguments(aee: AsyncIOEventEmitter) -> None:
+    with pytest.raises(ValueError):
+        aee.on_debounced("foo", make_listener(), wait=0)
+
+    with pytest.raises(ValueError):
+        aee.on_throttled("foo", interval=WAIT, leading=False, trailing=False)
+
+    with pytest.raises(ValueError):
+        aee.set_debounce("foo", -1)
+
+    assert aee.listeners("foo") == []
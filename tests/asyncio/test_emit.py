@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import sys
+from typing import Any, Optional
 
 import pytest
 from utils import make_async_listener, make_listener, trackable
@@ -217,3 +219,129 @@ async def test_side_effect_of_emit2(aee: AsyncIOEventEmitter) -> None:
     await aee.emit("foo")
     assert history == {"listener1", "listener2"}
     assert aee.listeners("foo") == []
+
+
+@pytest.mark.asyncio
+async def test_emit_synchronous_listener_inline(aee: AsyncIOEventEmitter) -> None:
+    tasks: list[Optional[asyncio.Task[Any]]] = []
+
+    @aee.on("foo")
+    def listener1(*args: Any, **kwargs: Any) -> None:
+        tasks.append(asyncio.current_task())
+
+    @aee.on("foo")
+    def listener2(*args: Any, **kwargs: Any) -> None:
+        tasks.append(asyncio.current_task())
+
+    await aee.emit("foo")
+    assert tasks == [asyncio.current_task(), asyncio.current_task()]
+
+
+@pytest.mark.asyncio
+async def test_emit_error_from_synchronous_listener(aee: AsyncIOEventEmitter) -> None:
+    listener1 = trackable(make_async_listener())
+    listener2 = trackable(make_listener())
+
+    @aee.on("foo")
+    def on_foo(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError()
+
+    aee.on("foo", listener1)
+    aee.on("foo", listener2)
+
+    with pytest.raises(RuntimeError):
+        await aee.emit("foo")
+
+    assert listener1.hits == 1
+    assert listener2.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_emit_eagerly() -> None:
+    aee = AsyncIOEventEmitter(eager=True)
+    history: list[str] = []
+
+    @aee.on("foo")
+    async def listener1(*args: Any, **kwargs: Any) -> None:
+        history.append("listener1")
+
+    @aee.on("foo")
+    async def listener2(*args: Any, **kwargs: Any) -> None:
+        await asyncio.sleep(0)
+        history.append("listener2")
+
+    @aee.on("foo")
+    async def listener3(*args: Any, **kwargs: Any) -> None:
+        history.append("listener3")
+
+    asyncio.get_running_loop().call_soon(history.append, "callback")
+    await aee.emit("foo")
+
+    if sys.version_info >= (3, 12):
+        # Listeners that complete without suspending run before the callbacks already scheduled
+        assert history == ["listener1", "listener3", "callback", "listener2"]
+    else:
+        assert history == ["callback", "listener1", "listener3", "listener2"]
+
+
+@pytest.mark.asyncio
+async def test_emit_eagerly_error() -> None:
+    aee = AsyncIOEventEmitter(eager=True)
+    listener = trackable(make_async_listener())
+
+    @aee.on("foo")
+    async def on_foo(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError()
+
+    aee.on("foo", listener)
+
+    with pytest.raises(RuntimeError):
+        await aee.emit("foo")
+
+    assert listener.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_emit_with_max_concurrency() -> None:
+    aee = AsyncIOEventEmitter(max_concurrency=3)
+    running = 0
+    peak = 0
+    completed = 0
+
+    async def listener(*args: Any, **kwargs: Any) -> None:
+        nonlocal running, peak, completed
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        completed += 1
+
+    for _ in range(10):
+        aee.on("foo", listener)
+
+    assert await aee.emit("foo")
+    assert peak == 3
+    assert completed == 10
+
+
+@pytest.mark.asyncio
+async def test_emit_with_max_concurrency_error() -> None:
+    aee = AsyncIOEventEmitter(max_concurrency=2)
+    listener = trackable(make_async_listener())
+
+    @aee.on("foo")
+    async def on_foo(*args: Any, **kwargs: Any) -> None:
+        raise RuntimeError()
+
+    for _ in range(5):
+        aee.on("foo", listener)
+
+    with pytest.raises(RuntimeError):
+        await aee.emit("foo")
+
+    assert listener.hits == 5
+
+
+def test_invalid_max_concurrency() -> None:
+    with pytest.raises(ValueError):
+        AsyncIOEventEmitter(max_concurrency=0)
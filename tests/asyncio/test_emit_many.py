@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from utils import fail, make_async_listener, make_listener, trackable
+
+from eventemitter import AsyncIOEventEmitter
+
+
+@pytest.mark.asyncio
+async def test_emit_many(aee: AsyncIOEventEmitter) -> None:
+    listener1 = trackable(make_async_listener())
+    listener2 = trackable(make_listener())
+
+    aee.on("foo", listener1)
+    aee.on("foo", listener2)
+
+    assert await aee.emit_many("foo", [(1,), (2, 3), ()], bar=4)
+    assert [context.args for context in listener1.contexts] == [(1,), (2, 3), ()]
+    assert [context.kwargs for context in listener1.contexts] == [{"bar": 4}] * 3
+    assert listener2.contexts == listener1.contexts
+
+    assert not await aee.emit_many("bar", [(1,)])
+
+
+@pytest.mark.asyncio
+async def test_emit_many_order(aee: AsyncIOEventEmitter) -> None:
+    calls = []
+
+    async def first(value: int) -> None:
+        calls.append(("first", value))
+
+    aee.on("foo", first)
+    aee.on("foo", lambda value: calls.append(("second", value)))
+
+    await aee.emit_many("foo", ((value,) for value in range(2)))
+    assert sorted(calls[:2]) == [("first", 0), ("second", 0)]
+    assert sorted(calls[2:]) == [("first", 1), ("second", 1)]
+
+
+@pytest.mark.asyncio
+async def test_emit_many_once(aee: AsyncIOEventEmitter) -> None:
+    listener1 = trackable(make_async_listener())
+    listener2 = trackable(make_async_listener())
+
+    aee.once("foo", listener1)
+    aee.on("foo", listener2)
+
+    await aee.emit_many("foo", [(1,), (2,), (3,)])
+    assert [context.args for context in listener1.contexts] == [(1,)]
+    assert listener2.hits == 3
+    assert aee.listeners("foo") == [listener2]
+
+
+@pytest.mark.asyncio
+async def test_emit_many_empty(aee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    aee.once("foo", listener)
+    aee.on_batch("foo", fail)
+
+    assert await aee.emit_many("foo", [])
+    assert listener.hits == 0
+    assert aee.listeners("foo") == [listener, fail]
+
+
+@pytest.mark.asyncio
+async def test_on_batch(aee: AsyncIOEventEmitter) -> None:
+    batches = []
+    listener = trackable(make_async_listener())
+
+    async def batch_listener(batch: list[tuple[Any, ...]], **kwargs: Any) -> None:
+        batches.append((batch, kwargs))
+
+    aee.on_batch("foo", batch_listener)
+    aee.on("foo", listener)
+
+    await aee.emit_many("foo", [(1,), (2,)], bar=3)
+    assert batches == [([(1,), (2,)], {"bar": 3})]
+    assert listener.hits == 2
+
+    await aee.emit("foo", 4, bar=5)
+    assert batches[-1] == ([(4,)], {"bar": 5})
+
+    await aee.emit_in_order("foo", 6)
+    assert batches[-1] == ([(6,)], {})
+
+
+@pytest.mark.asyncio
+async def test_emit_many_error(aee: AsyncIOEventEmitter) -> None:
+    async def raise_error(value: int) -> None:
+        if value == 2:
+            raise ValueError
+
+    listener = trackable(make_async_listener())
+
+    aee.on("foo", raise_error)
+    aee.on("foo", listener)
+
+    with pytest.raises(ValueError):
+        await aee.emit_many("foo", [(1,), (2,), (3,)])
+
+    # The other listeners of the failing payload still run
+    assert listener.hits == 2
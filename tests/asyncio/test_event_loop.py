@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+from utils import make_async_listener
+
+from eventemitter import AsyncIOEventEmitter
+from eventemitter.utils import EventLoopThread, run_coroutine
+
+
+@pytest.mark.asyncio
+async def test_reuse_event_loop_thread(aee: AsyncIOEventEmitter) -> None:
+    threads: list[threading.Thread] = []
+
+    @aee.on("new_listener")
+    async def on_new_listener(*args: Any, **kwargs: Any) -> None:
+        threads.append(threading.current_thread())
+
+    aee.on("foo", make_async_listener())
+    aee.on("bar", make_async_listener())
+    aee.remove_all_listeners("foo")
+    aee.on("foo", make_async_listener())
+
+    assert len(threads) == 3
+    assert len(set(threads)) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+def test_run_coroutine_without_running_loop() -> None:
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    assert run_coroutine(add, 1, 2) == 3
+    assert run_coroutine(add, a=3, b=4) == 7
+
+
+def test_run_coroutine_nested() -> None:
+    async def inner() -> str:
+        return "inner"
+
+    async def outer() -> str:
+        return run_coroutine(inner)
+
+    assert run_coroutine(outer) == "inner"
+
+
+def test_shutdown_event_loop_thread() -> None:
+    async def identity(value: int) -> int:
+        return value
+
+    event_loop_thread = EventLoopThread()
+    assert not event_loop_thread.running
+
+    assert event_loop_thread.run(identity, 42) == 42
+    assert event_loop_thread.running
+
+    event_loop_thread.shutdown()
+    assert not event_loop_thread.running
+
+    assert event_loop_thread.run(identity, 24) == 24
+    event_loop_thread.shutdown()
+    event_loop_thread.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_synchronous_listener_without_event_loop_thread(aee: AsyncIOEventEmitter) -> None:
+    threads: list[threading.Thread] = []
+
+    @aee.on("new_listener")
+    def on_new_listener(*args: Any, **kwargs: Any) -> None:
+        threads.append(threading.current_thread())
+
+    aee.on("foo", make_async_listener())
+    assert threads == [threading.current_thread()]
@@ -64,3 +64,16 @@ async def test_event_new_listener2(aee: AsyncIOEventEmitter) -> None:
     aee.on("hello", listener1)
 
     assert aee.listeners("hello") == [listener2, listener1]
+
+
+@pytest.mark.asyncio
+async def test_event_new_listener_without_listeners(aee: AsyncIOEventEmitter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(aee, "_emit_until_complete", fail)
+
+    listener = make_async_listener()
+    aee.on("foo", listener)
+    aee.once("foo", listener)
+    aee.prepend_listener("foo", listener)
+    aee.prepend_once_listener("foo", listener)
+
+    assert aee.listeners("foo") == [listener, listener, listener, listener]
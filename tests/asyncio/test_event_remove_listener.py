@@ -116,3 +116,23 @@ async def test_event_remove_listener5(aee: AsyncIOEventEmitter) -> None:
 
     await aee.emit("hello")
     assert on_remove_listener.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_event_remove_listener_without_listeners(
+    aee: AsyncIOEventEmitter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(aee, "_emit_until_complete", fail)
+
+    listener = trackable(make_async_listener())
+    aee.on("foo", listener)
+    aee.once("foo", listener)
+    aee.on("bar", listener)
+
+    await aee.emit("foo")
+    assert listener.hits == 2
+    assert aee.listeners("foo") == [listener]
+
+    aee.remove_listener("foo", listener)
+    aee.remove_all_listeners()
+    assert aee.events() == []
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+from utils import make_async_listener, trackable
+
+from eventemitter import AsyncIOEventEmitter
+
+
+@pytest.fixture
+def haee() -> AsyncIOEventEmitter:
+    return AsyncIOEventEmitter(hierarchical=True)
+
+
+@pytest.mark.asyncio
+async def test_bubbling(haee: AsyncIOEventEmitter) -> None:
+    calls = []
+
+    async def on_db(value: int) -> None:
+        calls.append(("db", value))
+
+    haee.on(("db",), on_db)
+    haee.on(("db", "users"), lambda value: calls.append(("db.users", value)))
+
+    assert await haee.emit(("db", "users", "insert"), 1)
+    assert await haee.emit_in_order(("db", "users"), 2)
+    assert not await haee.emit(("cache",), 3)
+
+    # Synchronous listeners are called before asynchronous ones by `emit()`
+    assert calls == [("db.users", 1), ("db", 1), ("db.users", 2), ("db", 2)]
+
+
+@pytest.mark.asyncio
+async def test_ancestor_once(haee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    haee.once(("db",), listener)
+
+    assert await haee.emit(("db", "users"))
+    assert not await haee.emit(("db", "users"))
+    assert listener.hits == 1
+    assert haee.events() == []
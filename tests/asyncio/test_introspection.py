@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+from utils import make_async_listener
+
+from eventemitter import AsyncIOEventEmitter
+
+
+@pytest.mark.asyncio
+async def test_introspection(aee: AsyncIOEventEmitter) -> None:
+    listener = make_async_listener()
+
+    aee.once("foo", listener)
+    assert aee.has_listeners("foo")
+    assert list(aee.iter_events()) == ["foo"]
+    assert list(aee.iter_listeners("foo")) == [listener]
+
+    await aee.emit("foo")
+    assert not aee.has_listeners()
+    assert list(aee.iter_events()) == []
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+from utils import make_async_listener
+
+from eventemitter import AsyncIOEventEmitter, MaxListenersExceededWarning
+
+
+@pytest.mark.asyncio
+async def test_max_listeners(aee: AsyncIOEventEmitter) -> None:
+    aee.set_max_listeners(1)
+    aee.once("foo", make_async_listener())
+
+    with pytest.warns(MaxListenersExceededWarning) as record:
+        aee.on("foo", make_async_listener())
+
+    assert record[0].filename == __file__
+    assert aee.listener_count() == 2
+
+    await aee.emit("foo")
+    assert aee.listener_count("foo") == 1
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+
+import pytest
+import pytest_asyncio
+from utils import make_async_listener, make_listener, trackable
+
+from eventemitter import AsyncIOQueueEventEmitter
+
+
+def values(listener: Any) -> list[Any]:
+    return [context.args[0] for context in listener.contexts]
+
+
+@pytest_asyncio.fixture
+async def qee() -> AsyncIterator[AsyncIOQueueEventEmitter]:
+    qee = AsyncIOQueueEventEmitter(maxsize=2)
+    yield qee
+    await qee.close()
+
+
+@pytest.mark.asyncio
+async def test_emit(qee: AsyncIOQueueEventEmitter) -> None:
+    listener1 = trackable(make_async_listener())
+    listener2 = trackable(make_listener())
+
+    qee.on("foo", listener1)
+    qee.on("foo", listener2)
+
+    assert await qee.emit("foo", 1)
+    assert listener1.hits == 0
+
+    await qee.join()
+    assert values(listener1) == [1]
+    assert values(listener2) == [1]
+
+    assert not await qee.emit("bar")
+
+
+@pytest.mark.asyncio
+async def test_emit_in_order(qee: AsyncIOQueueEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    qee.on("foo", listener)
+
+    await qee.emit_many("foo", [(value,) for value in range(5)])
+    await qee.join()
+    assert values(listener) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_overflow_block() -> None:
+    event = asyncio.Event()
+
+    async def listener(value: int) -> None:
+        await event.wait()
+
+    qee = AsyncIOQueueEventEmitter(maxsize=1)
+    qee.on("foo", listener)
+
+    await qee.emit("foo", 0)
+    await asyncio.sleep(0)  # The worker takes the first emit
+    await qee.emit("foo", 1)
+
+    blocked = asyncio.ensure_future(qee.emit("foo", 2))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    event.set()
+    await blocked
+    await qee.join()
+    await qee.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("overflow", "expected"), [("drop_oldest", [0, 3]), ("drop_newest", [0, 1])])
+async def test_overflow_drop(overflow: Any, expected: list[int]) -> None:
+    event = asyncio.Event()
+    calls = []
+
+    async def listener(value: int) -> None:
+        await event.wait()
+        calls.append(value)
+
+    qee = AsyncIOQueueEventEmitter(maxsize=1, overflow=overflow)
+    qee.on("foo", listener)
+
+    await qee.emit("foo", 0)
+    await asyncio.sleep(0)
+    for value in range(1, 4):
+        assert await qee.emit("foo", value)
+
+    event.set()
+    await qee.join()
+    assert calls == expected
+    await qee.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_raise() -> None:
+    qee = AsyncIOQueueEventEmitter(maxsize=1, overflow="raise")
+    qee.on("foo", make_async_listener())
+
+    await qee.emit("foo", 0)
+    with pytest.raises(asyncio.QueueFull):
+        await qee.emit("foo", 1)
+
+    await qee.close()
+
+
+@pytest.mark.asyncio
+async def test_per_listener() -> None:
+    event = asyncio.Event()
+    fast = trackable(make_listener())
+
+    async def slow(value: int) -> None:
+        await event.wait()
+
+    qee = AsyncIOQueueEventEmitter(per_listener=True)
+    qee.on("foo", slow)
+    qee.on("foo", fast)
+
+    for value in range(3):
+        await qee.emit("foo", value)
+
+    # A slow listener does not hold back the others
+    await asyncio.sleep(0.01)
+    assert values(fast) == [0, 1, 2]
+
+    event.set()
+    await qee.join()
+    await qee.close()
+
+
+@pytest.mark.asyncio
+async def test_once(qee: AsyncIOQueueEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    qee.once("foo", listener)
+
+    await qee.emit("foo", 1)
+    await qee.emit("foo", 2)
+    await qee.join()
+    assert values(listener) == [1]
+
+
+@pytest.mark.asyncio
+async def test_error(qee: AsyncIOQueueEventEmitter) -> None:
+    errors = []
+    listener = trackable(make_async_listener())
+
+    async def raise_error(value: int) -> None:
+        raise ValueError
+
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda loop, context: errors.append(context["exception"]))
+
+    qee.on("foo", raise_error)
+    qee.on("foo", listener)
+
+    await qee.emit("foo", 1)
+    await qee.emit("foo", 2)
+    await qee.join()
+
+    # The workers keep going after an error
+    assert len(errors) == 2
+    assert isinstance(errors[0], ValueError)
+    assert values(listener) == [1, 2]
+
+    loop.set_exception_handler(None)
+
+
+@pytest.mark.asyncio
+async def test_close(qee: AsyncIOQueueEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    qee.on("foo", listener)
+
+    await qee.emit("foo", 1)
+    await qee.close()
+    await asyncio.sleep(0)
+    assert listener.hits == 0
+
+    # Workers are started again on the next emit
+    await qee.emit("foo", 2)
+    await qee.join()
+    assert values(listener) == [2]
+
+
+@pytest.mark.asyncio
+async def test_meta_events(qee: AsyncIOQueueEventEmitter) -> None:
+    added = []
+
+    async def on_new_listener(event: str, listener: Any) -> None:
+        await asyncio.sleep(0)
+        added.append(event)
+
+    qee.on("new_listener", on_new_listener)
+    qee.on("foo", make_listener())
+
+    # Bypasses the queues, so the listener has finished by the time `on()` returns
+    assert added == ["foo"]
+
+    await qee.join()
+    await qee.close()
+
+
+@pytest.mark.asyncio
+async def test_context_manager() -> None:
+    listener = trackable(make_async_listener())
+
+    async with AsyncIOQueueEventEmitter() as qee:
+        qee.on("foo", listener)
+        await qee.emit("foo", 1)
+
+    assert values(listener) == [1]
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        AsyncIOQueueEventEmitter(maxsize=0)
+
+    with pytest.raises(ValueError):
+        AsyncIOQueueEventEmitter(workers=0)
+
+    with pytest.raises(ValueError):
+        AsyncIOQueueEventEmitter(overflow="ignore")  # type: ignore[arg-type]
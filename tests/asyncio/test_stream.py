@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from eventemitter import AsyncIOEventEmitter
+
+
+@pytest.mark.asyncio
+async def test_stream(aee: AsyncIOEventEmitter) -> None:
+    stream = aee.stream("foo")
+    assert len(aee.listeners("foo")) == 1
+
+    await aee.emit("foo", 1)
+    await aee.emit("foo", 2, 3)
+
+    assert await stream.__anext__() == (1,)
+    assert await stream.__anext__() == (2, 3)
+
+    await stream.aclose()
+    assert stream.closed
+    assert aee.listeners("foo") == []
+
+
+@pytest.mark.asyncio
+async def test_async_for(aee: AsyncIOEventEmitter) -> None:
+    received = []
+
+    async def consume() -> None:
+        async with aee.stream("foo") as stream:
+            async for (value,) in stream:
+                received.append(value)
+                if value == 2:
+                    break
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(0)
+
+    for value in range(3):
+        await aee.emit("foo", value)
+
+    await consumer
+    assert received == [0, 1, 2]
+    assert aee.listeners("foo") == []
+
+
+@pytest.mark.asyncio
+async def test_next_batch(aee: AsyncIOEventEmitter) -> None:
+    stream = aee.stream("foo")
+
+    await aee.emit_many("foo", [(value,) for value in range(5)])
+
+    assert await stream.next_batch(max_items=3) == [(0,), (1,), (2,)]
+    assert await stream.next_batch() == [(3,), (4,)]
+
+    await stream.aclose()
+    assert await stream.next_batch() == []
+
+
+@pytest.mark.asyncio
+async def test_overflow_block(aee: AsyncIOEventEmitter) -> None:
+    stream = aee.stream("foo", maxsize=1)
+
+    await aee.emit("foo", 1)
+    blocked = asyncio.ensure_future(aee.emit("foo", 2))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    assert await stream.__anext__() == (1,)
+    await blocked
+    assert await stream.__anext__() == (2,)
+
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_overflow_drop(aee: AsyncIOEventEmitter) -> None:
+    oldest = aee.stream("foo", maxsize=2, overflow="drop_oldest")
+    newest = aee.stream("foo", maxsize=2, overflow="drop_newest")
+
+    await aee.emit_many("foo", [(value,) for value in range(4)])
+
+    assert await oldest.next_batch() == [(2,), (3,)]
+    assert await newest.next_batch() == [(0,), (1,)]
+
+    await oldest.aclose()
+    await newest.aclose()
+
+
+@pytest.mark.asyncio
+async def test_overflow_raise(aee: AsyncIOEventEmitter) -> None:
+    stream = aee.stream("foo", maxsize=1, overflow="raise")
+
+    await aee.emit("foo", 1)
+    with pytest.raises(asyncio.QueueFull):
+        await aee.emit("foo", 2)
+
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_while_waiting(aee: AsyncIOEventEmitter) -> None:
+    stream = aee.stream("foo")
+
+    waiting = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    await stream.aclose()
+    with pytest.raises(StopAsyncIteration):
+        await waiting
+
+
+@pytest.mark.asyncio
+async def test_close_while_blocked(aee: AsyncIOEventEmitter) -> None:
+    stream = aee.stream("foo", maxsize=1)
+
+    await aee.emit("foo", 1)
+    blocked = [asyncio.ensure_future(aee.emit("foo", value)) for value in range(2, 5)]
+    await asyncio.sleep(0)
+
+    # Blocked emits are released rather than left waiting on a stream nobody consumes
+    await stream.aclose()
+    await asyncio.wait_for(asyncio.gather(*blocked), timeout=1)
+
+
+def test_invalid_arguments(aee: AsyncIOEventEmitter) -> None:
+    with pytest.raises(ValueError):
+        aee.stream("foo", maxsize=0)
+
+    with pytest.raises(ValueError):
+        aee.stream("foo", overflow="ignore")  # type: ignore[arg-type]
+
+    assert aee.listeners("foo") == []
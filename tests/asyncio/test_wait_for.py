@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from eventemitter import AsyncIOEventEmitter, AsyncIOQueueEventEmitter
+
+
+@pytest.mark.asyncio
+async def test_wait_for(aee: AsyncIOEventEmitter) -> None:
+    waiting = asyncio.ensure_future(aee.wait_for("foo"))
+    await asyncio.sleep(0)
+
+    # Waiting does not count as listening
+    assert aee.listeners("foo") == []
+    assert await aee.emit("foo", 1, 2, bar=3) is False
+
+    assert await waiting == (1, 2)
+    assert aee._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_predicate(aee: AsyncIOEventEmitter) -> None:
+    waiting = asyncio.ensure_future(aee.wait_for("foo", lambda value: value > 1))
+    await asyncio.sleep(0)
+
+    await aee.emit("foo", 1)
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    await aee.emit("foo", 2)
+    assert await waiting == (2,)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_failing_predicate(aee: AsyncIOEventEmitter) -> None:
+    def predicate(value: int) -> bool:
+        raise RuntimeError(value)
+
+    waiting = asyncio.ensure_future(aee.wait_for("foo", predicate))
+    await asyncio.sleep(0)
+
+    await aee.emit("foo", 1)
+    with pytest.raises(RuntimeError):
+        await waiting
+
+    assert aee._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_many(aee: AsyncIOEventEmitter) -> None:
+    waiting = [asyncio.ensure_future(aee.wait_for("foo")) for _ in range(100)]
+    waiting.append(asyncio.ensure_future(aee.wait_for("foo", lambda value: value == 3)))
+    await asyncio.sleep(0)
+
+    await aee.emit_many("foo", [(value,) for value in range(5)])
+
+    results = await asyncio.gather(*waiting)
+    assert results == [(0,)] * 100 + [(3,)]
+    assert aee._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_with_listeners(aee: AsyncIOEventEmitter) -> None:
+    received = []
+    aee.on("foo", received.append)
+
+    waiting = asyncio.ensure_future(aee.wait_for("foo"))
+    await asyncio.sleep(0)
+
+    await aee.emit_in_order("foo", 1)
+    assert await waiting == (1,)
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_timeout(aee: AsyncIOEventEmitter) -> None:
+    with pytest.raises(asyncio.TimeoutError):
+        await aee.wait_for("foo", timeout=0.01)
+
+    assert aee._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_cancel(aee: AsyncIOEventEmitter) -> None:
+    waiting = asyncio.ensure_future(aee.wait_for("foo"))
+    other = asyncio.ensure_future(aee.wait_for("foo"))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert len(aee._waiters["foo"]) == 1
+
+    await aee.emit("foo", 1)
+    assert await other == (1,)
+    assert aee._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_new_listener(aee: AsyncIOEventEmitter) -> None:
+    def listener() -> None:
+        pass
+
+    aee.on("new_listener", lambda event, listener: None)
+    waiting = asyncio.ensure_future(aee.wait_for("new_listener"))
+    await asyncio.sleep(0)
+
+    # Added from another thread, which has no running event loop
+    await asyncio.get_running_loop().run_in_executor(None, aee.on, "foo", listener)
+    assert await asyncio.wait_for(waiting, timeout=1) == ("foo", listener)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_queued() -> None:
+    released = asyncio.Event()
+
+    async def listener(value: int) -> None:
+        await released.wait()
+
+    qee = AsyncIOQueueEventEmitter(maxsize=1, overflow="drop_newest")
+    qee.on("foo", listener)
+
+    await qee.emit("foo", 1)
+    await asyncio.sleep(0)
+    await qee.emit("foo", 2)
+
+    # Resolved by the emits made after the wait started, not by the ones still queued or dropped
+    waiting = asyncio.ensure_future(qee.wait_for("foo"))
+    await asyncio.sleep(0)
+    await qee.emit("foo", 3)
+    released.set()
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    await qee.emit("foo", 4)
+    assert await waiting == (4,)
+
+    await qee.join()
+    await qee.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_queued_new_listener() -> None:
+    async def on_new_listener(event: str, listener: object) -> None:
+        pass
+
+    qee = AsyncIOQueueEventEmitter()
+    qee.on("new_listener", on_new_listener)
+    waiting = asyncio.ensure_future(qee.wait_for("new_listener"))
+    await asyncio.sleep(0)
+
+    qee.on("foo", on_new_listener)
+    assert await asyncio.wait_for(waiting, timeout=1) == ("foo", on_new_listener)
+    await qee.close()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import gc
+from typing import Any
+
+import pytest
+
+from eventemitter import AsyncIOEventEmitter
+
+
+class Receiver:
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+
+    async def on_foo(self, value: Any) -> None:
+        self.values.append(value)
+
+
+@pytest.mark.asyncio
+async def test_bound_method() -> None:
+    aee = AsyncIOEventEmitter(weak=True)
+    receiver = Receiver()
+    aee.on("foo", receiver.on_foo)
+
+    assert await aee.emit("foo", 1)
+    assert receiver.values == [1]
+
+    values = receiver.values
+    del receiver
+    gc.collect()
+
+    assert await aee.emit("foo", 2)
+    assert not await aee.emit_in_order("foo", 3)
+    assert values == [1]
+
+
+@pytest.mark.asyncio
+async def test_remove_bound_method() -> None:
+    aee = AsyncIOEventEmitter(weak=True)
+    receiver1 = Receiver()
+    receiver2 = Receiver()
+
+    aee.on("foo", receiver1.on_foo)
+    aee.on("foo", receiver2.on_foo)
+    aee.remove_listener("foo", receiver1.on_foo)
+
+    assert await aee.emit("foo", 1)
+    assert (receiver1.values, receiver2.values) == ([], [1])
+    assert aee.listeners("foo") == [receiver2.on_foo]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from utils import make_async_listener, trackable
+
+from eventemitter import AsyncIOEventEmitter
+
+
+@pytest.fixture
+def waee() -> AsyncIOEventEmitter:
+    return AsyncIOEventEmitter(wildcard=True)
+
+
+@pytest.mark.asyncio
+async def test_wildcard(waee: AsyncIOEventEmitter) -> None:
+    listener1 = trackable(make_async_listener())
+    listener2 = trackable(make_async_listener())
+
+    waee.on("order.*", listener1)
+    waee.on("**.failed", listener2)
+
+    assert await waee.emit("order.failed", 1)
+    assert await waee.emit_in_order("order.created", 2)
+    assert await waee.emit("order.payment.failed", 3)
+    assert not await waee.emit("payment.created", 4)
+
+    assert [context.args for context in listener1.contexts] == [(1,), (2,)]
+    assert [context.args for context in listener2.contexts] == [(1,), (3,)]
+
+
+@pytest.mark.asyncio
+async def test_pattern_once(waee: AsyncIOEventEmitter) -> None:
+    listener = trackable(make_async_listener())
+
+    waee.once("order.*", listener)
+
+    assert await waee.emit("order.created")
+    assert not await waee.emit("order.created")
+    assert listener.hits == 1
+    assert waee.events() == []
+
+
+@pytest.mark.asyncio
+async def test_pattern_max_delay(waee: AsyncIOEventEmitter) -> None:
+    batches = []
+
+    waee.on_batch("order.*", batches.append, max_delay=0.05)
+    await waee.emit("order.created", 1)
+    await waee.emit("order.created", 2)
+
+    await asyncio.sleep(0.1)
+    assert batches == [[(1,), (2,)]]
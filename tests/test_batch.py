@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+from utils import make_listener, trackable
+
+from eventemitter import EventEmitter
+
+
+def test_max_size(ee: EventEmitter) -> None:
+    batches = []
+    listener = trackable(make_listener())
+
+    ee.on_batch("foo", batches.append, max_size=3)
+    ee.on("foo", listener)
+
+    for value in range(7):
+        ee.emit("foo", value)
+
+    # Per-sample listeners are not affected
+    assert listener.hits == 7
+    assert batches == [[(0,), (1,), (2,)], [(3,), (4,), (5,)]]
+
+    ee.flush()
+    assert batches[-1] == [(6,)]
+
+
+def test_max_size_emit_many(ee: EventEmitter) -> None:
+    batches = []
+
+    ee.on_batch("foo", batches.append, max_size=2)
+
+    ee.emit_many("foo", [(value,) for value in range(5)])
+    assert batches == [[(0,), (1,)], [(2,), (3,)]]
+
+    ee.emit("foo", 5)
+    assert batches[-1] == [(4,), (5,)]
+
+
+def test_max_delay(ee: EventEmitter) -> None:
+    batches = []
+
+    ee.on_batch("foo", batches.append, max_delay=0.05)
+
+    ee.emit("foo", 1)
+    ee.emit("foo", 2)
+    assert batches == []
+
+    time.sleep(0.1)
+
+    # The time window is checked when the event is emitted again
+    ee.emit("foo", 3)
+    assert batches == [[(1,), (2,), (3,)]]
+
+
+def test_flush(ee: EventEmitter) -> None:
+    foo_batches = []
+    bar_batches = []
+
+    ee.on_batch("foo", foo_batches.append, max_size=10)
+    ee.on_batch("bar", bar_batches.append, max_size=10)
+
+    ee.emit("foo", 1)
+    ee.emit("bar", 2)
+
+    ee.flush("foo")
+    assert foo_batches == [[(1,)]]
+    assert bar_batches == []
+
+    ee.flush()
+    assert bar_batches == [[(2,)]]
+
+    # Nothing is left to deliver
+    ee.flush()
+    assert len(foo_batches) == 1
+    assert len(bar_batches) == 1
+
+
+def test_columnar(ee: EventEmitter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("eventemitter.batching.numpy", None)
+
+    batches = []
+
+    ee.on_batch("foo", batches.append, max_size=3, columnar=True)
+
+    ee.emit_many("foo", [(1, "a"), (2, "b"), (3, "c")])
+    assert batches == [[[1, 2, 3], ["a", "b", "c"]]]
+
+
+def test_columnar_numpy(ee: EventEmitter) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    batches = []
+
+    ee.on_batch("foo", batches.append, columnar=True)
+
+    ee.emit_many("foo", [(1, 1.5), (2, 2.5)])
+    assert isinstance(batches[0][0], numpy.ndarray)
+    assert batches[0][0].tolist() == [1, 2]
+    assert batches[0][1].tolist() == [1.5, 2.5]
+
+
+def test_kwargs(ee: EventEmitter) -> None:
+    calls = []
+
+    def listener(batch: list[tuple[Any, ...]], **kwargs: Any) -> None:
+        calls.append((batch, kwargs))
+
+    ee.on_batch("foo", listener, max_size=2)
+
+    ee.emit("foo", 1, bar=1)
+    ee.emit("foo", 2, bar=2)
+    assert calls == [([(1,), (2,)], {"bar": 2})]
+
+
+def test_remove_listener(ee: EventEmitter) -> None:
+    batches = []
+    listener = batches.append
+
+    ee.on_batch("foo", listener, max_size=2)
+
+    ee.emit("foo", 1)
+    ee.remove_listener("foo", listener)
+    ee.flush()
+    assert batches == []
+
+
+def test_invalid_arguments(ee: EventEmitter) -> None:
+    with pytest.raises(ValueError):
+        ee.on_batch("foo", print, max_size=0)
+
+    with pytest.raises(ValueError):
+        ee.on_batch("foo", max_delay=0)
+
+    assert ee.listeners("foo") == []
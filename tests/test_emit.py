@@ -97,3 +97,20 @@ def test_side_effect_of_emit2(ee: EventEmitter) -> None:
     ee.emit("foo")
     assert history == ["listener1", "listener2"]
     assert ee.listeners("foo") == []
+
+
+def test_handlers_snapshot(ee: EventEmitter) -> None:
+    listener1 = make_listener()
+    listener2 = make_listener()
+
+    ee.on("foo", listener1)
+    handlers = ee._events.handlers("foo")
+    assert ee._events.handlers("foo") is handlers
+
+    ee.emit("foo")
+    assert ee._events.handlers("foo") is handlers
+
+    ee.on("foo", listener2)
+    assert ee._events.handlers("foo") is not handlers
+    assert [handler.func for handler in handlers] == [listener1]
+    assert [handler.func for handler in ee._events.handlers("foo")] == [listener1, listener2]
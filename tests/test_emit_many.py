@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from utils import fail, make_listener, trackable
+
+from eventemitter import EventEmitter
+
+
+def test_emit_many(ee: EventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = trackable(make_listener())
+
+    ee.on("foo", listener1)
+    ee.on("foo", listener2)
+
+    assert ee.emit_many("foo", [(1,), (2, 3), ()], bar=4)
+    assert [context.args for context in listener1.contexts] == [(1,), (2, 3), ()]
+    assert [context.kwargs for context in listener1.contexts] == [{"bar": 4}] * 3
+    assert listener2.contexts == listener1.contexts
+
+    assert not ee.emit_many("bar", [(1,)])
+
+
+def test_emit_many_order(ee: EventEmitter) -> None:
+    calls = []
+
+    ee.on("foo", lambda value: calls.append(("first", value)))
+    ee.on("foo", lambda value: calls.append(("second", value)))
+
+    ee.emit_many("foo", ((value,) for value in range(2)))
+    assert calls == [("first", 0), ("second", 0), ("first", 1), ("second", 1)]
+
+
+def test_emit_many_once(ee: EventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = trackable(make_listener())
+
+    ee.once("foo", listener1)
+    ee.on("foo", listener2)
+
+    ee.emit_many("foo", [(1,), (2,), (3,)])
+    assert [context.args for context in listener1.contexts] == [(1,)]
+    assert listener2.hits == 3
+    assert ee.listeners("foo") == [listener2]
+
+
+def test_emit_many_empty(ee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    ee.once("foo", listener)
+    ee.on_batch("foo", fail)
+
+    assert ee.emit_many("foo", [])
+    assert listener.hits == 0
+    assert ee.listeners("foo") == [listener, fail]
+
+
+def test_on_batch(ee: EventEmitter) -> None:
+    batches = []
+    listener = trackable(make_listener())
+
+    ee.on_batch("foo", lambda batch, **kwargs: batches.append((batch, kwargs)))
+    ee.on("foo", listener)
+
+    ee.emit_many("foo", [(1,), (2,)], bar=3)
+    assert batches == [([(1,), (2,)], {"bar": 3})]
+    assert listener.hits == 2
+
+    ee.emit("foo", 4, bar=5)
+    assert batches[-1] == ([(4,)], {"bar": 5})
+
+
+def test_on_batch_decorator(ee: EventEmitter) -> None:
+    batches = []
+
+    @ee.on_batch("foo")
+    def listener(batch: list[tuple[Any, ...]]) -> None:
+        batches.append(batch)
+
+    ee.emit_many("foo", [(1,), (2,)])
+    assert batches == [[(1,), (2,)]]
+    assert ee.listeners("foo") == [listener]
+
+
+def test_on_batch_after_payloads(ee: EventEmitter) -> None:
+    calls = []
+
+    ee.on_batch("foo", lambda batch: calls.append(("batch", len(batch))))
+    ee.on("foo", lambda value: calls.append(("payload", value)))
+
+    ee.emit_many("foo", [(1,), (2,)])
+    assert calls == [("payload", 1), ("payload", 2), ("batch", 2)]
+
+
+def test_emit_many_error(ee: EventEmitter) -> None:
+    def raise_error(value: int) -> None:
+        if value == 2:
+            raise ValueError
+
+    listener = trackable(make_listener())
+
+    ee.on("foo", raise_error)
+    ee.on("foo", listener)
+
+    with pytest.raises(ValueError):
+        ee.emit_many("foo", [(1,), (2,), (3,)])
+
+    assert listener.hits == 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 from utils import fail, make_listener, trackable
 
 from eventemitter import EventEmitter
@@ -61,3 +62,15 @@ def test_event_new_listener2(ee: EventEmitter) -> None:
     ee.on("hello", listener1)
 
     assert ee.listeners("hello") == [listener2, listener1]
+
+
+def test_event_new_listener_without_listeners(ee: EventEmitter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ee, "_emit_until_complete", fail)
+
+    listener = make_listener()
+    ee.on("foo", listener)
+    ee.once("foo", listener)
+    ee.prepend_listener("foo", listener)
+    ee.prepend_once_listener("foo", listener)
+
+    assert ee.listeners("foo") == [listener, listener, listener, listener]
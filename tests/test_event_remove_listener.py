@@ -1,3 +1,4 @@
+import pytest
 from utils import fail, make_listener, trackable
 
 from eventemitter import EventEmitter
@@ -110,3 +111,20 @@ def test_event_remove_listener5(ee: EventEmitter) -> None:
 
     ee.emit("hello")
     assert on_remove_listener.hits == 1
+
+
+def test_event_remove_listener_without_listeners(ee: EventEmitter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ee, "_emit_until_complete", fail)
+
+    listener = trackable(make_listener())
+    ee.on("foo", listener)
+    ee.once("foo", listener)
+    ee.on("bar", listener)
+
+    ee.emit("foo")
+    assert listener.hits == 2
+    assert ee.listeners("foo") == [listener]
+
+    ee.remove_listener("foo", listener)
+    ee.remove_all_listeners()
+    assert ee.events() == []
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+from utils import make_listener, trackable
+
+from eventemitter import EventEmitter
+
+
+@pytest.fixture
+def hee() -> EventEmitter:
+    return EventEmitter(hierarchical=True)
+
+
+def test_bubbling(hee: EventEmitter) -> None:
+    calls = []
+
+    hee.on(("db",), lambda *args: calls.append(("db", args)))
+    hee.on(("db", "users"), lambda *args: calls.append(("db.users", args)))
+    hee.on(("db", "users", "insert"), lambda *args: calls.append(("db.users.insert", args)))
+
+    assert hee.emit(("db", "users", "insert"), 1)
+    assert calls == [("db.users.insert", (1,)), ("db.users", (1,)), ("db", (1,))]
+
+    calls.clear()
+    assert hee.emit(("db", "orders", "delete"), 2)
+    assert hee.emit(("db", "users"), 3)
+    assert not hee.emit(("cache", "users"), 4)
+    assert calls == [("db", (2,)), ("db.users", (3,)), ("db", (3,))]
+
+
+def test_registration_changes(hee: EventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = trackable(make_listener())
+
+    hee.on(("db", "users"), listener1)
+    hee.emit(("db", "users", "insert"))
+    hee.emit(("db", "orders", "insert"))
+
+    hee.on(("db",), listener2)
+    hee.emit(("db", "users", "insert"))
+    hee.emit(("db", "orders", "insert"))
+    assert (listener1.hits, listener2.hits) == (2, 2)
+
+    hee.remove_listener(("db", "users"), listener1)
+    hee.emit(("db", "users", "insert"))
+    assert (listener1.hits, listener2.hits) == (2, 3)
+
+    hee.remove_all_listeners(("db",))
+    assert not hee.emit(("db", "users", "insert"))
+
+
+def test_ancestor_once(hee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+    removed = []
+
+    hee.once(("db",), listener)
+    hee.on("remove_listener", lambda event, listener: removed.append(event))
+
+    assert hee.emit(("db", "users", "insert"))
+    assert not hee.emit(("db", "users", "insert"))
+    assert listener.hits == 1
+    assert removed == [("db",)]
+
+
+def test_other_events(hee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    hee.on("db", listener)
+    hee.on(("db",), listener)
+
+    # Only tuples have ancestors
+    hee.emit("db")
+    hee.emit(("db", "users"))
+    assert listener.hits == 2
+
+
+def test_empty_tuple(hee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    hee.on((), listener)
+
+    # The empty tuple is an event of its own, rather than the root of every other one
+    assert hee.emit(())
+    assert not hee.emit(("db",))
+    assert listener.hits == 1
+
+
+def test_disabled(ee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+    ee.on(("db",), listener)
+
+    assert not ee.emit(("db", "users"))
+    assert listener.hits == 0
+
+
+def test_wildcard() -> None:
+    with pytest.raises(ValueError):
+        EventEmitter(wildcard=True, hierarchical=True)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+from utils import make_listener
+
+from eventemitter import EventEmitter
+
+
+def test_has_listeners(ee: EventEmitter) -> None:
+    assert not ee.has_listeners()
+    assert not ee.has_listeners("foo")
+
+    ee.once("foo", make_listener())
+    assert ee.has_listeners()
+    assert ee.has_listeners("foo")
+    assert not ee.has_listeners("bar")
+
+    ee.emit("foo")
+    assert not ee.has_listeners()
+    assert not ee.has_listeners("foo")
+
+
+def test_iter_events(ee: EventEmitter) -> None:
+    ee.on("foo", make_listener())
+    ee.on(123, make_listener())
+
+    events = ee.iter_events()
+    assert list(events) == ["foo", 123] == ee.events()
+
+    events = ee.iter_events()
+    next(events)
+    ee.on("bar", make_listener())
+    with pytest.raises(RuntimeError):
+        next(events)
+
+
+def test_iter_listeners(ee: EventEmitter) -> None:
+    listener1 = make_listener()
+    listener2 = make_listener()
+
+    ee.on("foo", listener1)
+    listeners = ee.iter_listeners("foo")
+
+    # Goes over the listeners as they were when the iterator was created
+    ee.on("foo", listener2)
+    assert list(listeners) == [listener1]
+    assert list(ee.iter_listeners("foo")) == [listener1, listener2]
+    assert list(ee.iter_listeners("bar")) == []
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import warnings
+
+import pytest
+from utils import make_listener
+
+from eventemitter import EventEmitter, MaxListenersExceededWarning
+
+
+def test_max_listeners(ee: EventEmitter) -> None:
+    assert ee.get_max_listeners() == EventEmitter.default_max_listeners == 10
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(10):
+            ee.on("foo", make_listener())
+
+    with pytest.warns(MaxListenersExceededWarning) as record:
+        ee.on("foo", make_listener())
+
+    # Pointing at where the listener was added
+    assert record[0].filename == __file__
+    assert "11 listeners" in str(record[0].message)
+
+    # Issued once per event
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        ee.prepend_listener("foo", make_listener())
+
+    assert ee.listener_count("foo") == 12
+
+
+def test_prepend(ee: EventEmitter) -> None:
+    ee.set_max_listeners(1)
+    ee.once("foo", make_listener())
+
+    with pytest.warns(MaxListenersExceededWarning):
+        ee.prepend_once_listener("foo", make_listener())
+
+
+def test_warned_again(ee: EventEmitter) -> None:
+    ee.set_max_listeners(1)
+
+    # Once all the listeners of the event are removed, a new leak is warned about
+    for remove in [lambda: ee.remove_all_listeners("foo"), lambda: ee.emit("foo")]:
+        ee.once("foo", make_listener())
+        with pytest.warns(MaxListenersExceededWarning):
+            ee.once("foo", make_listener())
+
+        remove()
+        assert ee.events() == []
+
+
+def test_event_max_listeners(ee: EventEmitter) -> None:
+    ee.set_max_listeners(2).set_max_listeners(0, "bar")
+    assert ee.get_max_listeners("foo") == 2
+    assert ee.get_max_listeners("bar") == 0
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(100):
+            ee.on("bar", make_listener())
+
+    ee.on("foo", make_listener())
+    ee.on("foo", make_listener())
+    with pytest.warns(MaxListenersExceededWarning):
+        ee.on("foo", make_listener())
+
+
+def test_invalid_max_listeners(ee: EventEmitter) -> None:
+    with pytest.raises(ValueError):
+        ee.set_max_listeners(-1)
+
+
+def test_listener_count(ee: EventEmitter) -> None:
+    listener = make_listener()
+
+    ee.on("foo", listener)
+    ee.on("foo", listener)
+    ee.once("bar", make_listener())
+    assert ee.listener_count("foo") == 2
+    assert ee.listener_count("bar") == 1
+    assert ee.listener_count("baz") == 0
+    assert ee.listener_count() == 3
+
+    ee.emit("bar")
+    ee.remove_listener("foo", listener)
+    assert ee.listener_count("bar") == 0
+    assert ee.listener_count() == 1
+
+    ee.on("bar", make_listener())
+    ee.remove_all_listeners("foo")
+    assert ee.listener_count() == 1
+
+    ee.remove_all_listeners()
+    assert ee.listener_count() == 0
+
+
+def test_listener_count_wildcard() -> None:
+    ee = EventEmitter(wildcard=True)
+
+    ee.on("order.*", make_listener())
+    ee.once("order.created", make_listener())
+
+    # Only the listeners added for the name itself are counted
+    assert ee.listener_count("order.created") == 1
+    assert ee.listener_count() == 2
+
+    ee.emit("order.created")
+    assert ee.listener_count() == 1
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from typing import Any, Iterator
+
+import pytest
+from utils import make_listener, trackable
+
+from eventemitter import ProcessPoolEventEmitter
+
+
+class ListenerError(Exception):
+    pass
+
+
+# Listeners of a `ProcessPoolEventEmitter` must be picklable, so they are defined at the top level
+def square(value: int) -> int:
+    return value * value
+
+
+def negate(value: int) -> int:
+    return -value
+
+
+def pid(*args: Any, **kwargs: Any) -> int:
+    return os.getpid()
+
+
+def raise_error(*args: Any, **kwargs: Any) -> None:
+    raise ListenerError
+
+
+@pytest.fixture(params=[1, 2], ids=["unchunked", "chunked"])
+def pee(request: pytest.FixtureRequest) -> Iterator[ProcessPoolEventEmitter]:
+    # Forking is unsafe once other tests have started threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolEventEmitter(max_workers=2, chunksize=request.param, mp_context=context) as pee:
+        yield pee
+
+
+def test_emit(pee: ProcessPoolEventEmitter) -> None:
+    pee.on("foo", square)
+
+    assert pee.emit("foo", 2)
+    assert not pee.emit("bar")
+
+
+def test_submit(pee: ProcessPoolEventEmitter) -> None:
+    pee.on("foo", square)
+    pee.on("foo", negate)
+    pee.on("foo", square)
+
+    futures = pee.submit("foo", 3)
+    assert [future.result() for future in futures] == [9, -3, 9]
+
+    assert pee.submit("bar") == []
+
+
+def test_emit_in_worker_processes(pee: ProcessPoolEventEmitter) -> None:
+    pee.on("foo", pid)
+
+    first = pee.submit("foo")[0].result()
+    second = pee.submit("foo")[0].result()
+
+    assert first != os.getpid()
+    assert second != os.getpid()
+
+
+def test_emit_error(pee: ProcessPoolEventEmitter) -> None:
+    pee.on("foo", raise_error)
+    pee.on("foo", square)
+
+    with pytest.raises(ListenerError):
+        pee.emit("foo", 2)
+
+    futures = pee.submit("foo", 2)
+    assert isinstance(futures[0].exception(), ListenerError)
+    assert futures[1].result() == 4
+
+
+def test_once(pee: ProcessPoolEventEmitter) -> None:
+    pee.once("foo", square)
+
+    assert len(pee.submit("foo", 2)) == 1
+    assert pee.submit("foo", 2) == []
+    assert pee.listeners("foo") == []
+
+
+def test_unpicklable_listener(pee: ProcessPoolEventEmitter) -> None:
+    with pytest.raises(ValueError):
+        pee.on("foo", lambda: None)
+
+    with pytest.raises(ValueError):
+        pee.prepend_once_listener("foo", make_listener())
+
+    assert pee.listeners("foo") == []
+
+
+def test_unpicklable_arguments(pee: ProcessPoolEventEmitter) -> None:
+    pee.on("foo", square)
+
+    with pytest.raises(Exception):  # noqa: B017
+        pee.emit("foo", lambda: None)
+
+
+def test_meta_events_inline(pee: ProcessPoolEventEmitter) -> None:
+    # Listeners of meta events run in this process, so they can be closures
+    listener = trackable(make_listener())
+
+    pee.on("new_listener", listener)
+    pee.on("foo", square)
+
+    assert listener.contexts[-1].args == ("foo", square)
+
+
+def test_invalid_chunksize() -> None:
+    with pytest.raises(ValueError):
+        ProcessPoolEventEmitter(chunksize=0)
+
+
+def test_submit_many(pee: ProcessPoolEventEmitter) -> None:
+    pee.once("foo", negate)
+    pee.on("foo", square)
+    pee.on_batch("foo", len)
+
+    futures = pee.submit_many("foo", [(1,), (2,), (3,)])
+    assert [future.result() for future in futures] == [-1, 1, 4, 9, 3]
+
+    assert pee.emit_many("foo", [(1,)])
+    assert not pee.emit_many("bar", [(1,)])
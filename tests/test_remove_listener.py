@@ -57,3 +57,46 @@ def test_remove_listener4(ee: EventEmitter) -> None:
 
     ee.remove_listener("foo", listener1)
     assert ee.listeners("foo") == [listener2]
+
+
+def test_remove_listener5(ee: EventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = make_listener()
+
+    ee.prepend_once_listener("foo", listener1)
+    ee.on("foo", listener2)
+    ee.on("foo", listener1)
+    ee.prepend_listener("foo", listener2)
+    assert ee.listeners("foo") == [listener2, listener1, listener2, listener1]
+
+    # The last instance in the listeners list is removed, no matter how it has been added
+    ee.remove_listener("foo", listener1)
+    assert ee.listeners("foo") == [listener2, listener1, listener2]
+
+    ee.emit("foo")
+    ee.emit("foo")
+    assert listener1.hits == 1
+    assert ee.listeners("foo") == [listener2, listener2]
+
+    ee.remove_listener("foo", listener2)
+    ee.remove_listener("foo", listener2)
+    assert ee.listeners("foo") == []
+    assert ee.events() == []
+
+
+def test_remove_listener6(ee: EventEmitter) -> None:
+    class Receiver:
+        def on_foo(self) -> None:
+            pass
+
+    receiver1 = Receiver()
+    receiver2 = Receiver()
+
+    # A bound method is made anew on every attribute access, so the one removed is not the one added
+    ee.on("foo", receiver1.on_foo)
+    ee.on("foo", receiver2.on_foo)
+    ee.remove_listener("foo", receiver1.on_foo)
+    assert ee.listeners("foo") == [receiver2.on_foo]
+
+    ee.remove_listener("foo", receiver2.on_foo)
+    assert ee.events() == []
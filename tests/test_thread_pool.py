@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+
+import pytest
+from utils import make_listener, trackable
+
+from eventemitter import ThreadPoolEventEmitter
+
+
+@pytest.fixture
+def tee() -> Iterator[ThreadPoolEventEmitter]:
+    with ThreadPoolEventEmitter(max_workers=4) as tee:
+        yield tee
+
+
+def test_emit(tee: ThreadPoolEventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = trackable(make_listener())
+
+    tee.on("foo", listener1)
+    tee.on("foo", listener2)
+
+    assert tee.emit("foo", 1, bar=2)
+    assert listener1.contexts[-1].args == (1,)
+    assert listener1.contexts[-1].kwargs == {"bar": 2}
+    assert listener2.hits == 1
+
+    assert not tee.emit("bar")
+
+
+def test_emit_in_worker_threads(tee: ThreadPoolEventEmitter) -> None:
+    threads = []
+
+    tee.on("foo", lambda: threads.append(threading.current_thread()))
+
+    tee.emit("foo")
+    assert threads[0] is not threading.current_thread()
+
+
+def test_emit_concurrently(tee: ThreadPoolEventEmitter) -> None:
+    # Both listeners must be running at the same time to get through the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    tee.on("foo", barrier.wait)
+    tee.on("foo", barrier.wait)
+
+    tee.emit("foo")
+
+
+def test_emit_error(tee: ThreadPoolEventEmitter) -> None:
+    class FirstError(Exception):
+        pass
+
+    class SecondError(Exception):
+        pass
+
+    def raise_first(*args: Any, **kwargs: Any) -> None:
+        raise FirstError
+
+    def raise_second(*args: Any, **kwargs: Any) -> None:
+        raise SecondError
+
+    listener = trackable(make_listener())
+
+    tee.on("foo", raise_first)
+    tee.on("foo", listener)
+    tee.on("foo", raise_second)
+
+    with pytest.raises(FirstError):
+        tee.emit("foo")
+
+    assert listener.hits == 1
+
+
+def test_once(tee: ThreadPoolEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    tee.once("foo", listener)
+
+    tee.emit("foo")
+    tee.emit("foo")
+    assert listener.hits == 1
+    assert tee.listeners("foo") == []
+
+
+def test_submit(tee: ThreadPoolEventEmitter) -> None:
+    event = threading.Event()
+
+    def blocked() -> int:
+        assert event.wait(timeout=5)
+        return 1
+
+    tee.on("foo", blocked)
+    tee.on("foo", lambda: 2)
+
+    futures = tee.submit("foo")
+    assert not futures[0].done()
+
+    event.set()
+    assert [future.result() for future in futures] == [1, 2]
+
+    assert tee.submit("bar") == []
+
+
+def test_fire_and_forget() -> None:
+    event = threading.Event()
+    listener = trackable(make_listener(lambda: event.wait(timeout=5)))
+
+    with ThreadPoolEventEmitter(wait=False) as tee:
+        tee.on("foo", listener)
+
+        assert tee.emit("foo")
+        event.set()
+
+    # Shutting down waits for the listeners that are still running
+    assert listener.hits == 1
+
+
+def test_meta_events_inline(tee: ThreadPoolEventEmitter) -> None:
+    threads = []
+
+    tee.on("new_listener", lambda *args: threads.append(threading.current_thread()))
+    tee.on("foo", make_listener())
+
+    assert threads == [threading.current_thread()]
+
+
+def test_executor() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tee = ThreadPoolEventEmitter(executor=executor)
+        listener = trackable(make_listener())
+
+        tee.on("foo", listener)
+        tee.emit("foo")
+        tee.shutdown()
+
+        # An executor passed in is left running
+        tee.emit("foo")
+        assert listener.hits == 2
+
+
+def test_shutdown(tee: ThreadPoolEventEmitter) -> None:
+    listener = trackable(make_listener())
+
+    tee.on("foo", listener)
+    tee.emit("foo")
+    tee.shutdown()
+
+    # A new executor is created on the next emit
+    tee.emit("foo")
+    assert listener.hits == 2
+
+
+def test_emit_many(tee: ThreadPoolEventEmitter) -> None:
+    listener = trackable(make_listener())
+    batches = []
+
+    tee.once("foo", listener)
+    tee.on("foo", listener)
+    tee.on_batch("foo", batches.append)
+
+    assert tee.emit_many("foo", [(1,), (2,)])
+    assert sorted(context.args for context in listener.contexts) == [(1,), (1,), (2,)]
+    assert batches == [[(1,), (2,)]]
+
+    assert not tee.emit_many("bar", [(1,)])
+
+
+def test_submit_many(tee: ThreadPoolEventEmitter) -> None:
+    tee.on("foo", lambda value: value * 2)
+    tee.on_batch("foo", len)
+
+    futures = tee.submit_many("foo", [(1,), (2,), (3,)])
+    assert [future.result() for future in futures] == [2, 4, 6, 3]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import gc
+from typing import Any, Callable
+
+import pytest
+from utils import make_listener, trackable
+
+from eventemitter import EventEmitter, ProcessPoolEventEmitter
+
+
+class Receiver:
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+
+    def on_foo(self, value: Any) -> None:
+        self.values.append(value)
+
+
+@pytest.fixture
+def wee() -> EventEmitter:
+    return EventEmitter(weak=True)
+
+
+def test_bound_method(wee: EventEmitter) -> None:
+    receiver = Receiver()
+    wee.on("foo", receiver.on_foo)
+
+    assert wee.emit("foo", 1)
+    assert receiver.values == [1]
+    assert wee.listeners("foo") == [receiver.on_foo]
+
+    values = receiver.values
+    del receiver
+    gc.collect()
+
+    # Dropped the next time it would have been called
+    assert wee.listeners("foo") == []
+    assert wee.events() == ["foo"]
+    assert wee.emit("foo", 2)
+    assert wee.events() == []
+    assert values == [1]
+
+
+def test_function(wee: EventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = trackable(make_listener())
+
+    wee.on("foo", listener1)
+    wee.on("foo", listener2)
+    wee.emit("foo")
+
+    del listener2
+    gc.collect()
+
+    wee.emit("foo")
+    assert listener1.hits == 2
+    assert wee.listeners("foo") == [listener1]
+
+
+def test_remove_listener(wee: EventEmitter) -> None:
+    receiver = Receiver()
+    removed = []
+
+    def on_remove_listener(event: str, listener: Any) -> None:
+        removed.append(listener)
+
+    listener = receiver.on_foo
+    wee.on("remove_listener", on_remove_listener)
+    wee.on("foo", listener)
+    wee.remove_listener("foo", listener)
+
+    assert removed == [listener]
+    assert wee.listeners("foo") == []
+
+
+def test_remove_bound_method(wee: EventEmitter) -> None:
+    receiver1 = Receiver()
+    receiver2 = Receiver()
+
+    # Every `receiver.on_foo` is a new bound method, which is gone right after being passed in
+    wee.on("foo", receiver1.on_foo)
+    wee.on("bar", receiver2.on_foo)
+    wee.remove_listener("foo", receiver1.on_foo)
+    assert wee.listeners("foo") == []
+    assert wee.listeners("bar") == [receiver2.on_foo]
+
+    wee.on("foo", receiver1.on_foo)
+    wee.on("foo", receiver2.on_foo)
+    wee.remove_listener("foo", receiver1.on_foo)
+    assert wee.listeners("foo") == [receiver2.on_foo]
+
+    wee.emit("foo", 1)
+    assert (receiver1.values, receiver2.values) == ([], [1])
+
+    wee.remove_listener("foo", receiver2.on_foo)
+    assert wee.events() == ["bar"]
+
+
+def test_listener_count(wee: EventEmitter) -> None:
+    receiver = Receiver()
+    wee.on("foo", receiver.on_foo)
+
+    del receiver
+    gc.collect()
+
+    # A listener that is gone is counted until it is dropped
+    assert wee.listeners("foo") == []
+    assert wee.listener_count("foo") == 1
+    assert wee.has_listeners("foo")
+
+    wee.emit("foo", 1)
+    assert wee.listener_count("foo") == 0
+    assert not wee.has_listeners()
+
+
+def test_not_referenceable(wee: EventEmitter) -> None:
+    values: list[Any] = []
+
+    with pytest.raises(ValueError):
+        wee.on("foo", values.append)
+
+    assert wee.listeners("foo") == []
+
+
+def test_strong(ee: EventEmitter) -> None:
+    receiver = Receiver()
+    ee.on("foo", receiver.on_foo)
+
+    values = receiver.values
+    del receiver
+    gc.collect()
+
+    ee.emit("foo", 1)
+    assert values == [1]
+
+
+def test_process_pool() -> None:
+    with pytest.raises(ValueError):
+        ProcessPoolEventEmitter(weak=True)
+
+
+def test_reused_id(wee: EventEmitter) -> None:
+    calls = []
+
+    def make_counted_listener() -> Callable[[], None]:
+        def listener() -> None:
+            calls.append(listener)
+
+        return listener
+
+    # A function made right after another one is gone usually takes its address, and so its id
+    for _ in range(100):
+        listener1 = make_counted_listener()
+        listener_id = id(listener1)
+        wee.on("foo", listener1)
+
+        del listener1
+        gc.collect()
+
+        listener2 = make_counted_listener()
+        if id(listener2) == listener_id:
+            break
+
+        wee.remove_all_listeners()
+    else:
+        pytest.skip("No id has been reused")
+
+    wee.prepend_listener("foo", listener2)
+    wee.remove_listener("foo", listener2)
+
+    wee.emit("foo")
+    assert calls == []
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from utils import make_listener, trackable
+
+from eventemitter import EventEmitter
+
+
+@pytest.fixture
+def wee() -> EventEmitter:
+    return EventEmitter(wildcard=True)
+
+
+def test_wildcard(wee: EventEmitter) -> None:
+    calls = []
+
+    wee.on("order.*", lambda *args: calls.append(("order.*", args)))
+    wee.on("*.failed", lambda *args: calls.append(("*.failed", args)))
+    wee.on("order.failed", lambda *args: calls.append(("order.failed", args)))
+
+    assert wee.emit("order.failed", 1)
+    assert calls == [("order.failed", (1,)), ("order.*", (1,)), ("*.failed", (1,))]
+
+    calls.clear()
+    assert wee.emit("order.created", 2)
+    assert wee.emit("payment.failed", 3)
+    assert not wee.emit("order.created.late", 4)
+    assert not wee.emit("order", 5)
+    assert calls == [("order.*", (2,)), ("*.failed", (3,))]
+
+
+def test_globstar(wee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+    wee.on("order.**", listener)
+
+    for event in ["order", "order.created", "order.created.late"]:
+        assert wee.emit(event, event)
+
+    assert not wee.emit("payment.created")
+    assert [context.args for context in listener.contexts] == [("order",), ("order.created",), ("order.created.late",)]
+
+
+def test_pattern_order(wee: EventEmitter) -> None:
+    calls = []
+
+    wee.on("**", lambda *args: calls.append("**"))
+    wee.on("*.*", lambda: calls.append("*.*"))
+    wee.on("a.*", lambda: calls.append("a.*"))
+
+    # `**` also matches the `new_listener` events of the other two
+    calls.clear()
+    wee.emit("a.b")
+    assert calls == ["**", "*.*", "a.*"]
+
+
+def test_registration_changes(wee: EventEmitter) -> None:
+    listener1 = trackable(make_listener())
+    listener2 = trackable(make_listener())
+
+    wee.on("order.*", listener1)
+    wee.emit("order.created")
+
+    wee.on("order.created", listener2)
+    wee.emit("order.created")
+    assert (listener1.hits, listener2.hits) == (2, 1)
+
+    wee.remove_listener("order.*", listener1)
+    wee.emit("order.created")
+    assert (listener1.hits, listener2.hits) == (2, 2)
+
+    wee.on("*.created", listener1)
+    wee.remove_all_listeners("order.created")
+    assert wee.emit("order.created")
+    assert (listener1.hits, listener2.hits) == (3, 2)
+
+    wee.remove_all_listeners()
+    assert not wee.emit("order.created")
+
+
+def test_pattern_once(wee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+    removed = []
+
+    wee.once("order.*", listener)
+    wee.on("remove_listener", lambda event, listener: removed.append(event))
+
+    assert wee.emit("order.created")
+    assert not wee.emit("order.created")
+    assert listener.hits == 1
+    assert removed == ["order.*"]
+    assert wee.events() == ["remove_listener"]
+
+
+def test_pattern_listeners(wee: EventEmitter) -> None:
+    listener = make_listener()
+    wee.on("order.*", listener)
+
+    # Patterns are registered under their own name
+    assert wee.events() == ["order.*"]
+    assert wee.listeners("order.*") == [listener]
+    assert wee.listeners("order.created") == []
+
+
+def test_meta_events(wee: EventEmitter) -> None:
+    calls: list[Any] = []
+    listener = make_listener()
+
+    wee.on("*", lambda *args: calls.append(args))
+
+    # Patterns matching the meta events are told about listeners, as their own listeners would be
+    wee.on("foo", listener)
+    wee.remove_listener("foo", listener)
+    assert calls == [("foo", listener), ("foo", listener)]
+
+
+def test_emit_many(wee: EventEmitter) -> None:
+    batches = []
+
+    wee.on_batch("order.*", batches.append)
+    wee.emit_many("order.created", [(1,), (2,)])
+
+    assert batches == [[(1,), (2,)]]
+
+
+def test_delimiter() -> None:
+    ee = EventEmitter(wildcard=True, delimiter="/")
+    listener = trackable(make_listener())
+
+    ee.on("order/*", listener)
+    ee.emit("order/created")
+    ee.emit("order.created")
+    assert listener.hits == 1
+
+    with pytest.raises(ValueError):
+        EventEmitter(wildcard=True, delimiter="")
+
+
+def test_disabled(ee: EventEmitter) -> None:
+    listener = trackable(make_listener())
+    ee.on("order.*", listener)
+
+    assert not ee.emit("order.created")
+    assert ee.emit("order.*")
+    assert listener.hits == 1
+
+
+def test_other_events(wee: EventEmitter) -> None:
+    calls: list[Any] = []
+
+    wee.on(("order", "created"), calls.append)
+    wee.on("**", calls.append)
+
+    # Only strings are matched against patterns
+    wee.emit(("order", "created"), 1)
+    wee.emit(42, 2)
+    assert calls == [1]